@@ -1,7 +1,7 @@
 # Version 1.0.9
 # modmanager.py - Mod Manager GUI with update checks and settings
 # NOTE: Designed to be run with Python 3.10+ and PyQt6 installed.
-# Uses only stdlib network (urllib) to avoid extra pip deps for update check.
+# Uses only stdlib network (urllib / http.client) to avoid extra pip deps for update check.
 
 import sys
 import os
@@ -9,18 +9,29 @@ import json
 import shutil
 import subprocess
 import threading
-import urllib.request
+import atexit
+import queue
+import time
+import contextlib
+import http.client
+import urllib.parse
 import urllib.error
+import urllib.request
+import base64
 import zipfile
 import tempfile
-from packaging import version as pkg_version  # packaging is often available; fallback handled below
+import functools
+try:
+    from packaging import version as pkg_version  # packaging is often available; fallback handled below
+except ImportError:
+    pkg_version = None
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton,
     QComboBox, QTabWidget, QGridLayout, QScrollArea, QFrame, QFileDialog,
     QListWidget, QListWidgetItem, QCheckBox
 )
 from PyQt6.QtGui import QPixmap, QFont
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QMetaObject, pyqtSignal
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
@@ -39,12 +50,43 @@ SETTINGS_FILE = os.path.join(RESOURCES, "settings.json")
 # -------------------- CONFIG --------------------
 GAMES = {"gi": "Genshin Impact", "hsr": "Honkai Star Rail", "wuwa": "Wuthering Waves", "zzz": "Zenless Zone Zero"}
 CATEGORIES = ["characters", "weapons", "ui", "objects", "npcs"]
+GAME_KEYS = list(GAMES)  # combo box row -> game key
+GAME_INDEX = {k: i for i, k in enumerate(GAME_KEYS)}  # game key -> combo box row
 
 GITHUB_RELEASES_API = "https://api.github.com/repos/Sanddino00/Mod-Manager/releases/latest"
 # expected filenames in release:
 EXPECTED_UPDATE_EXE_NAME = "update.exe"      # name of the installer/updater exe in releases
 EXPECTED_RESOURCES_ZIP_NAME = "resources.zip"  # name of resources zip in releases
 EXPECTED_MODMANAGER_EXE_NAME = "modmanager.exe"
+UPDATE_EXE_NAME_LOWER = EXPECTED_UPDATE_EXE_NAME.lower()  # asset names are compared case-insensitively
+HTTP_HEADERS = {"User-Agent": "ModManager-Updater"}
+HTTP_MAX_REDIRECTS = 5
+SETTINGS_SAVE_DELAY = 0.5  # seconds; settings changes within this window share one write
+UPDATE_CHECK_INTERVAL = 3600  # seconds; startup checks within this window reuse the stored tag
+DOWNLOAD_BLOCK_SIZE = 1 << 18  # 256 KiB per read/write
+PROGRESS_INTERVAL = 0.1  # seconds between download progress callbacks
+
+# watchdog: quiet period before a burst of filesystem events triggers one reload
+RELOAD_DEBOUNCE_MS = 200
+COUNTER_REFRESH_MS = 250
+TEMP_SUFFIXES = (".tmp", "~")  # partial files written by archivers/editors
+
+# -------------------- THEMES --------------------
+DARK_QSS = """
+    QWidget { background-color: #222; color: #eee; }
+    QScrollArea { background-color: #222; }
+    QTabWidget::pane { background: #222; }
+    QLabel, QPushButton, QComboBox, QListWidget { color: #eee; }
+    QListWidget::item:selected { background-color: #555555; color: #ffffff; }
+"""
+LIGHT_QSS = """
+    QWidget { background-color: #d3d3d3; color: #222; }  /* Light gray background */
+    QScrollArea { background-color: #d3d3d3; }
+    QTabWidget::pane { background: #ccc; }
+    QLabel, QPushButton, QComboBox { color: #222; }
+    QListWidget { background-color: #444444; color: #ffffff; } /* Dark gray mod list */
+    QListWidget::item:selected { background-color: #666666; color: #ffffff; }
+"""
 
 # -------------------- SETTINGS --------------------
 default_mod_paths = {
@@ -81,22 +123,129 @@ else:
                 "install_path_info": None
             }
 
+# one reusable encoder; output matches json.dump(settings, f, indent=2)
+_encode_settings = json.JSONEncoder(indent=2).encode
+# serialized shadow of what was last written, so unchanged settings are not rewritten
+_last_serialized = _encode_settings(settings)
+
 # -------------------- WATCHDOG --------------------
 class ModFolderHandler(FileSystemEventHandler):
-    def __init__(self, callback):
-        self.callback = callback
+    def __init__(self, timer, counter_timer, dirty_ids):
+        self.root = None  # watched category folder; its direct children are item folders
+        self.selected_folder = None  # folder of the selected item, updated by the GUI
+        self.timer = timer
+        self.counter_timer = counter_timer
+        self.dirty_ids = dirty_ids
     def on_any_event(self, event):
         # ignore temporary events
-        self.callback()
+        src_path = str(event.src_path)
+        if src_path.endswith(TEMP_SUFFIXES):
+            return
+        # watchdog calls us from its observer thread: (re)start the single-shot
+        # timers on the GUI thread so a burst of events collapses into one refresh
+        root = self.root
+        if root:
+            # remember which item's counter went stale
+            self.dirty_ids.add(os.path.relpath(src_path, root).split(os.sep, 1)[0])
+            QMetaObject.invokeMethod(self.counter_timer, "start", Qt.ConnectionType.QueuedConnection)
+        selected = self.selected_folder
+        if selected and (src_path == selected or src_path.startswith(selected + os.sep)):
+            QMetaObject.invokeMethod(self.timer, "start", Qt.ConnectionType.QueuedConnection)
 
 # -------------------- UTILITIES --------------------
+class BackgroundWorker:
+    """Run submitted jobs one at a time on a daemon thread.
+
+    concurrent.futures workers are joined at interpreter exit, so a download in
+    flight would keep the process alive after the window closes; a daemon thread
+    is simply dropped instead.
+    """
+
+    def __init__(self, name):
+        self._jobs = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, *args):
+        if not self._closed:
+            self._jobs.put((fn, args))
+
+    def shutdown(self):
+        """Drop queued jobs; the one running (if any) dies with the process."""
+        self._closed = True
+        with contextlib.suppress(queue.Empty):
+            while True:
+                self._jobs.get_nowait()
+        self._jobs.put(None)
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            fn, args = job
+            try:
+                fn(*args)
+            except Exception as e:
+                print("Background job failed:", e)
+
+_save_lock = threading.Lock()
+_save_timer = None
+
 def save_settings():
+    """Schedule a settings write; calls within SETTINGS_SAVE_DELAY coalesce into one."""
+    global _save_timer
+    with _save_lock:
+        if _save_timer is not None:
+            _save_timer.cancel()
+        _save_timer = threading.Timer(SETTINGS_SAVE_DELAY, flush_settings)
+        _save_timer.daemon = True
+        _save_timer.start()
+
+def flush_settings():
+    """Write settings now if they changed, via a temp file + os.replace so a crash can't truncate them."""
+    global _last_serialized, _save_timer
+    with _save_lock:
+        if _save_timer is not None:
+            _save_timer.cancel()
+            _save_timer = None
+        try:
+            data = _encode_settings(settings)
+            if data == _last_serialized:
+                return  # nothing changed since the last write
+            tmp_path = SETTINGS_FILE + ".tmp"
+            with open(tmp_path, "w") as f:
+                f.write(data)
+            os.replace(tmp_path, SETTINGS_FILE)
+            _last_serialized = data
+        except Exception as e:
+            print("Failed to save settings:", e)
+
+# write any pending change on exit (also covers the sys.exit() after launching the updater)
+atexit.register(flush_settings)
+
+# (game, category) -> parsed item list; category JSONs are static while running
+_ITEMS_CACHE = {}
+
+def load_category_items(game, category):
+    """Return the items of resources/{category}_{game}.json, parsed once per session."""
+    key = (game, category)
+    items = _ITEMS_CACHE.get(key)
+    if items is not None:
+        return items
+    json_file = os.path.join(RESOURCES, f"{category}_{game}.json")
+    if not os.path.exists(json_file):
+        return []
     try:
-        with open(SETTINGS_FILE, "w") as f:
-            json.dump(settings, f, indent=2)
-    except Exception as e:
-        print("Failed to save settings:", e)
+        with open(json_file, "r", encoding="utf-8") as f:
+            items = json.load(f)
+    except Exception:
+        return []
+    _ITEMS_CACHE[key] = items
+    return items
 
+@functools.lru_cache(maxsize=32)
 def semver_normalize(tag):
     """Strip leading 'v' and return normalized semver string."""
     if not tag:
@@ -106,63 +255,235 @@ def semver_normalize(tag):
         t = t[1:]
     return t
 
+def _naive_version_key(v):
+    return [int(x) for x in v.split(".") if x.isdigit()]
+
+@functools.lru_cache(maxsize=32)
+def parse_version(v):
+    """Parse a normalized version string once; falls back to a list of ints."""
+    if pkg_version is not None:
+        try:
+            return pkg_version.parse(v)
+        except pkg_version.InvalidVersion:
+            pass
+    return _naive_version_key(v)
+
 def is_version_newer(installed, latest):
     """Compare semver strings. Returns True if latest > installed."""
+    if latest is None:
+        return False
+    i_ver = parse_version(installed)
+    l_ver = parse_version(latest)
+    if type(i_ver) is not type(l_ver):
+        # only one side is a valid packaging version: compare numerically
+        i_ver, l_ver = _naive_version_key(installed), _naive_version_key(latest)
+    return l_ver > i_ver
+
+# -------------------- HTTP --------------------
+# urlopen() pays a fresh TCP + TLS handshake per call. Idle keep-alive connections are
+# kept per (scheme, host) instead, so a release check followed by an asset download
+# (or a retry) reuses the already-open connection. Proxies are honoured the way
+# urlopen honours them.
+_HTTP_POOL = {}
+_HTTP_POOL_LOCK = threading.Lock()
+
+@functools.lru_cache(maxsize=None)
+def _system_proxies():
+    # HTTP(S)_PROXY from the environment, else the registry/system settings, as urlopen used
+    return urllib.request.getproxies()
+
+def _proxy_for(scheme, netloc):
+    """Return (proxy host, proxy port, Proxy-Authorization headers) or None for a direct connection."""
+    proxy = _system_proxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(urllib.parse.urlsplit("//" + netloc).hostname or netloc):
+        return None
+    parts = urllib.parse.urlsplit(proxy if "://" in proxy else "http://" + proxy)
+    auth = {}
+    if parts.username:
+        creds = f"{urllib.parse.unquote(parts.username)}:{urllib.parse.unquote(parts.password or '')}"
+        auth["Proxy-Authorization"] = "Basic " + base64.b64encode(creds.encode()).decode()
+    return parts.hostname, parts.port or (443 if parts.scheme == "https" else 80), auth
+
+def _new_connection(scheme, netloc, timeout, proxy):
+    if proxy is None:
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=timeout)
+        return http.client.HTTPConnection(netloc, timeout=timeout)
+    host, port, auth = proxy
+    if scheme == "https":
+        # CONNECT tunnel through the proxy; TLS is negotiated with netloc itself
+        conn = http.client.HTTPSConnection(host, port, timeout=timeout)
+        conn.set_tunnel(netloc, headers=auth)
+        return conn
+    return http.client.HTTPConnection(host, port, timeout=timeout)
+
+def _send_get(scheme, netloc, path, headers, timeout):
+    """Send a GET on an idle pooled connection (or a new one). Returns (conn, response)."""
+    proxy = _proxy_for(scheme, netloc)
+    if proxy is not None and scheme == "http":
+        # a plain HTTP proxy is sent the absolute URL instead of tunnelling
+        path = f"http://{netloc}{path}"
+        headers = dict(headers, **proxy[2])
+    with _HTTP_POOL_LOCK:
+        idle = _HTTP_POOL.get((scheme, netloc))
+        conn = idle.pop() if idle else None
+    if conn is not None:
+        try:
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            conn.request("GET", path, headers=headers)
+            return conn, conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            # the server dropped the idle connection; retry on a fresh one
+            conn.close()
+    conn = _new_connection(scheme, netloc, timeout, proxy)
     try:
-        # prefer packaging.version if available
-        return pkg_version.parse(latest) > pkg_version.parse(installed)
+        conn.request("GET", path, headers=headers)
+        return conn, conn.getresponse()
     except Exception:
-        # fallback naive compare
+        conn.close()
+        raise
+
+def _finish_response(scheme, netloc, conn, resp):
+    """Return conn to the pool if resp was fully read and keep-alive is allowed."""
+    if resp.isclosed() and not resp.will_close:
+        with _HTTP_POOL_LOCK:
+            _HTTP_POOL.setdefault((scheme, netloc), []).append(conn)
+    else:
+        conn.close()
+
+@contextlib.contextmanager
+def http_get(url, headers=None, timeout=15):
+    """
+    GET url over a pooled keep-alive connection, following redirects.
+    Yields the http.client response. Raises urllib.error.HTTPError for status >= 400.
+    """
+    request_headers = dict(HTTP_HEADERS, **(headers or {}))
+    for _ in range(HTTP_MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        conn, resp = _send_get(parts.scheme, parts.netloc, path, request_headers, timeout)
+        location = resp.getheader("Location")
+        if resp.status in (301, 302, 303, 307, 308) and location:
+            resp.read()
+            _finish_response(parts.scheme, parts.netloc, conn, resp)
+            url = urllib.parse.urljoin(url, location)
+            continue
+        if resp.status >= 400:
+            resp.read()
+            _finish_response(parts.scheme, parts.netloc, conn, resp)
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
         try:
-            i_parts = [int(x) for x in installed.split(".") if x.isdigit()]
-            l_parts = [int(x) for x in latest.split(".") if x.isdigit()]
-            return l_parts > i_parts
-        except Exception:
-            return latest != installed and latest is not None
+            yield resp
+        finally:
+            _finish_response(parts.scheme, parts.netloc, conn, resp)
+        return
+    raise urllib.error.URLError(f"Too many redirects fetching {url}")
+
+# ETag of the last release API response and the slim release dict built from it
+_LATEST_RELEASE_CACHE = {"etag": None, "release": None}
+
+def slim_release(data):
+    """Keep only the release fields the updater uses (drops release notes etc.)."""
+    return {
+        "tag_name": data.get("tag_name"),
+        "name": data.get("name"),
+        "assets": [
+            {"name": a.get("name"), "browser_download_url": a.get("browser_download_url")}
+            for a in data.get("assets", [])
+        ],
+    }
 
 def fetch_latest_release_info():
-    """Return dict with latest release JSON or None on error."""
+    """
+    Return dict with latest release info (tag_name, name, assets) or None on error.
+    Sends the previous ETag so an unchanged release comes back as 304 without a body.
+    """
+    headers = {"Accept": "application/vnd.github+json"}
+    if _LATEST_RELEASE_CACHE["etag"]:
+        headers["If-None-Match"] = _LATEST_RELEASE_CACHE["etag"]
     try:
-        req = urllib.request.Request(GITHUB_RELEASES_API, headers={"User-Agent": "ModManager-Updater"})
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            data = resp.read().decode("utf-8")
-            return json.loads(data)
+        with http_get(GITHUB_RELEASES_API, headers=headers, timeout=5) as resp:
+            data = resp.read()
+            if resp.status == 304 and _LATEST_RELEASE_CACHE["release"] is not None:
+                return _LATEST_RELEASE_CACHE["release"]
+            release = slim_release(json.loads(data.decode("utf-8")))
+            _LATEST_RELEASE_CACHE["etag"] = resp.getheader("ETag")
+            _LATEST_RELEASE_CACHE["release"] = release
+            return release
     except urllib.error.HTTPError as he:
         print("HTTP error fetching release info:", he)
     except Exception as e:
         print("Error fetching release info:", e)
     return None
 
+class ProgressReader:
+    """Wraps a readable response and reports progress at most every PROGRESS_INTERVAL seconds."""
+    def __init__(self, fileobj, total, callback):
+        self.fileobj = fileobj
+        self.total = total
+        self.callback = callback
+        self.received = 0
+        self.last_report = 0.0
+
+    def read(self, size=-1):
+        chunk = self.fileobj.read(size)
+        self.received += len(chunk)
+        now = time.monotonic()
+        # always report the final size on EOF
+        if not chunk or now - self.last_report >= PROGRESS_INTERVAL:
+            self.last_report = now
+            try:
+                self.callback(self.received, self.total)
+            except Exception:
+                pass
+        return chunk
+
 def download_url_to_path(url, dest_path, progress_callback=None):
     """
     Download a URL to destination path. Calls progress_callback(received, total) if provided.
     Returns True on success.
     """
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "ModManager-Updater"})
-        with urllib.request.urlopen(req, timeout=60) as resp:
+        with http_get(url, timeout=60) as resp:
             total = resp.getheader('Content-Length')
             total = int(total) if total and total.isdigit() else None
             os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-            with open(dest_path, "wb") as out:
-                downloaded = 0
-                block_size = 8192
-                while True:
-                    chunk = resp.read(block_size)
-                    if not chunk:
-                        break
-                    out.write(chunk)
-                    downloaded += len(chunk)
-                    if progress_callback:
-                        try:
-                            progress_callback(downloaded, total)
-                        except Exception:
-                            pass
+            source = ProgressReader(resp, total, progress_callback) if progress_callback else resp
+            # write to a .part file so a download cut short at exit never leaves a truncated dest_path
+            part_path = dest_path + ".part"
+            with open(part_path, "wb") as out:
+                shutil.copyfileobj(source, out, length=DOWNLOAD_BLOCK_SIZE)
+            os.replace(part_path, dest_path)
         return True
     except Exception as e:
         print(f"Download failed ({url} -> {dest_path}):", e)
         return False
 
+# icon path -> scaled QPixmap; QPixmap is implicitly shared, so handing it out again is cheap
+_ICON_CACHE = {}
+
+def load_icon(icon_path):
+    """Return the 100x100 icon for icon_path, decoding and scaling the PNG only once."""
+    pix = _ICON_CACHE.get(icon_path)
+    if pix is None:
+        pix = QPixmap(icon_path).scaled(100, 100, Qt.AspectRatioMode.KeepAspectRatio,
+                                        Qt.TransformationMode.SmoothTransformation)
+        _ICON_CACHE[icon_path] = pix
+    return pix
+
+def ensure_folders(paths):
+    """Create any missing folders in paths. Existing ones cost a single stat."""
+    for path in paths:
+        if os.path.isdir(path):
+            continue
+        try:
+            os.makedirs(path, exist_ok=True)
+        except Exception:
+            pass
+
 def open_folder(path):
     if sys.platform == "win32":
         os.startfile(path)
@@ -173,6 +494,13 @@ def open_folder(path):
 
 # -------------------- MOD MANAGER GUI --------------------
 class ModManager(QWidget):
+    # emitted from the rename worker thread with the mod's new path
+    mod_renamed = pyqtSignal(str)
+    # emitted from update_executor jobs; Qt queues them onto the GUI thread
+    update_status_changed = pyqtSignal(bool, str)
+    installer_downloaded = pyqtSignal()
+    updater_downloaded = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Mod Manager")
@@ -182,10 +510,36 @@ class ModManager(QWidget):
         self.selected_item = None
         self.items = []
         self.selected_mod_path = None
+        self._grid_cache = {}  # (game, category) -> built grid content widget
+        self._applied_theme = None
+        # one worker for release checks and downloads, so a download queued by an
+        # update button runs after (not alongside) a check already in flight
+        self.update_executor = BackgroundWorker("update-worker")
 
         self.observer = Observer()
         self.observer.start()
 
+        # debounced reload fired by ModFolderHandler
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(RELOAD_DEBOUNCE_MS)
+        self.reload_timer.timeout.connect(self.load_mods)
+
+        # ids of items whose folders changed; drained by counter_timer
+        self._counters_dirty = set()
+        self.counter_timer = QTimer(self)
+        self.counter_timer.setSingleShot(True)
+        self.counter_timer.setInterval(COUNTER_REFRESH_MS)
+        self.counter_timer.timeout.connect(self.refresh_dirty_counters)
+
+        # one long-lived recursive watch on the current category folder
+        self.folder_handler = ModFolderHandler(self.reload_timer, self.counter_timer, self._counters_dirty)
+        self._watch = None
+        self.mod_renamed.connect(self.on_mod_renamed)
+        self.update_status_changed.connect(self._apply_update_status)
+        self.installer_downloaded.connect(self.update_installer_exe)
+        self.updater_downloaded.connect(self._launch_updater)
+
         self.init_ui()
         # load items and start background update check
         self.load_items()
@@ -199,9 +553,8 @@ class ModManager(QWidget):
         # Top: Game selection + update dot
         top_layout = QHBoxLayout()
         self.game_combo = QComboBox()
-        for k,v in GAMES.items():
-            self.game_combo.addItem(v,k)
-        self.game_combo.setCurrentIndex(list(GAMES.keys()).index(self.selected_game))
+        self.game_combo.addItems(list(GAMES.values()))
+        self.game_combo.setCurrentIndex(GAME_INDEX[self.selected_game])
         self.game_combo.currentIndexChanged.connect(lambda _: self.change_game())
 
         top_layout.addStretch()
@@ -268,7 +621,7 @@ class ModManager(QWidget):
 
         self.mod_list_widget = QListWidget()
         self.mod_list_widget.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
-        self.mod_list_widget.itemClicked.connect(self.select_mod)
+        self.mod_list_widget.itemSelectionChanged.connect(self.select_mod)
         right_layout.addWidget(self.mod_list_widget)
         center_layout.addLayout(right_layout,1)
 
@@ -338,11 +691,14 @@ class ModManager(QWidget):
             settings["mod_paths"][game] = folder
             self.path_labels[game].setText(f"{GAMES[game]}: {folder}")
             save_settings()
+            # cached grids of this game point at the old folders
+            for key in [k for k in self._grid_cache if k[0] == game]:
+                del self._grid_cache[key]
             self.load_items()
 
     # -------------------- GAME / CATEGORY --------------------
     def change_game(self):
-        self.selected_game = self.game_combo.currentData()
+        self.selected_game = GAME_KEYS[self.game_combo.currentIndex()]
         self.load_items()
 
     def tab_changed(self,index):
@@ -351,6 +707,7 @@ class ModManager(QWidget):
             self.load_items()
         else:
             self.selected_item = None
+            self.folder_handler.selected_folder = None
             self.clear_mod_list()
 
     # -------------------- LOAD ITEMS --------------------
@@ -358,34 +715,47 @@ class ModManager(QWidget):
         if self.selected_category not in self.tabs:
             return
         self.selected_item = None
+        self.folder_handler.selected_folder = None
         tab_data = self.tabs[self.selected_category]
-        grid = tab_data["grid"]
-        # clear grid
-        for i in reversed(range(grid.count())):
-            widget = grid.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-
-        json_file = os.path.join(RESOURCES,f"{self.selected_category}_{self.selected_game}.json")
-        if os.path.exists(json_file):
-            try:
-                with open(json_file,"r", encoding="utf-8") as f:
-                    self.items = json.load(f)
-            except Exception:
-                self.items = []
-        else:
-            self.items = []
+        key = (self.selected_game, self.selected_category)
+        self.items = load_category_items(self.selected_game, self.selected_category)
+        base_path = os.path.join(
+            settings["mod_paths"].get(self.selected_game, default_mod_paths[self.selected_game]),
+            self.selected_category
+        )
+        self.watch_category(base_path)
 
-        # Auto-create main category subfolders
-        base_path = settings["mod_paths"].get(self.selected_game, default_mod_paths[self.selected_game])
+        content = self._grid_cache.get(key)
+        if content is None:
+            content = self.build_grid(base_path)
+            self._grid_cache[key] = content
+        else:
+            # grid already built for this game/category: only refresh counters
+            # (unchanged folders are served from the mtime cache)
+            for item in self.items:
+                self.update_mod_counter(item)
+
+        if tab_data["content"] is not content:
+            # takeWidget hands the current grid back to us; setWidget alone would delete it
+            tab_data["scroll"].takeWidget()
+            tab_data["scroll"].setWidget(content)
+            tab_data["content"] = content
+            tab_data["grid"] = content.layout()
+
+    def build_grid(self, base_path):
+        """Build the item grid widget for the current game/category from self.items."""
+        # Resolve each item's mod folder once
         for item in self.items:
-            folder = os.path.join(base_path, self.selected_category, item["id"])
-            try:
-                os.makedirs(folder, exist_ok=True)
-            except Exception:
-                pass
+            item["_folder"] = os.path.join(base_path, item["id"])
+
+        # Auto-create main category subfolders in the background so slow disks don't stall the grid
+        folders = [item["_folder"] for item in self.items]
+        threading.Thread(target=ensure_folders, args=(folders,), daemon=True).start()
 
         # populate grid
+        content = QWidget()
+        grid = QGridLayout()
+        content.setLayout(grid)
         row=0; col=0
         for item in self.items:
             btn = self.create_item_widget(item)
@@ -394,6 +764,23 @@ class ModManager(QWidget):
             if col >= 3:
                 col=0
                 row+=1
+        return content
+
+    def watch_category(self, root):
+        """Point the single recursive watch at root, rescheduling only when it changes."""
+        if root == self.folder_handler.root:
+            return
+        try:
+            if self._watch is not None:
+                self.observer.unschedule(self._watch)
+                self._watch = None
+            self.folder_handler.root = None
+            os.makedirs(root, exist_ok=True)
+            self._watch = self.observer.schedule(self.folder_handler, root, recursive=True)
+            self.folder_handler.root = root
+        except Exception:
+            # observer might not be running on some platforms but ignore for now
+            pass
 
     # -------------------- ITEM WIDGET --------------------
     def create_item_widget(self,item):
@@ -410,7 +797,7 @@ class ModManager(QWidget):
         )
         if os.path.exists(icon_path):
             try:
-                pix = QPixmap(icon_path).scaled(100, 100, Qt.AspectRatioMode.KeepAspectRatio)
+                pix = load_icon(icon_path)
                 icon_label = QLabel()
                 icon_label.setPixmap(pix)
                 icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -455,36 +842,32 @@ class ModManager(QWidget):
         self.selected_mod_path = None
 
     def load_mods(self):
+        # reloads are triggered by the watcher too; keep whatever mod was selected
+        previous = self.selected_mod_path
         self.clear_mod_list()
         if not self.selected_item:
             return
 
-        char_folder = os.path.join(
-            settings["mod_paths"].get(self.selected_game, default_mod_paths[self.selected_game]),
-            self.selected_category,
-            self.selected_item["id"]
-        )
+        char_folder = self.selected_item["_folder"]
         os.makedirs(char_folder, exist_ok=True)
-
-        # Watch folder: unschedule & schedule
-        try:
-            self.observer.unschedule_all()
-            self.observer.schedule(ModFolderHandler(self.load_mods), char_folder, recursive=True)
-        except Exception:
-            # observer might not be running on some platforms but ignore for now
-            pass
+        # the category watch is already in place; just tell it which folder to reload for
+        self.folder_handler.selected_folder = char_folder
 
         mods = []
         try:
-            for f in os.listdir(char_folder):
-                full_path = os.path.join(char_folder, f)
-                if os.path.isdir(full_path):
-                    disabled = f.startswith("DISABLED_")
-                    display_name = f.replace("DISABLED_", "")
-                    mods.append({"name": f, "display": display_name, "disabled": disabled, "path": full_path})
+            # scandir's DirEntry.is_dir() reuses the type from the directory listing,
+            # so no extra stat per entry (unlike listdir + os.path.isdir)
+            with os.scandir(char_folder) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        f = entry.name
+                        disabled = f.startswith("DISABLED_")
+                        display_name = f.replace("DISABLED_", "")
+                        mods.append({"name": f, "display": display_name, "disabled": disabled, "path": entry.path})
         except FileNotFoundError:
             pass
 
+        list_items = []
         for m in mods:
             item_text = m["display"]
             font = QFont()
@@ -496,27 +879,62 @@ class ModManager(QWidget):
             list_item = QListWidgetItem(item_text)
             list_item.setData(Qt.ItemDataRole.UserRole, m["path"])
             list_item.setFont(font)
-            self.mod_list_widget.addItem(list_item)
+            list_items.append(list_item)
 
-        self.update_mod_counters()
+        # insert as one batch: no per-row signals or repaints
+        self.mod_list_widget.setUpdatesEnabled(False)
+        self.mod_list_widget.blockSignals(True)
+        try:
+            for list_item in list_items:
+                self.mod_list_widget.addItem(list_item)
+        finally:
+            self.mod_list_widget.blockSignals(False)
+            self.mod_list_widget.setUpdatesEnabled(True)
+
+        if previous:
+            for row, list_item in enumerate(list_items):
+                if list_item.data(Qt.ItemDataRole.UserRole) == previous:
+                    self.mod_list_widget.setCurrentRow(row)
+                    break
+
+        # only the selected item's folder was rescanned; others refresh via refresh_dirty_counters
+        self.update_mod_counter(self.selected_item)
 
     # -------------------- MOD COUNTERS --------------------
-    def update_mod_counters(self):
+    def refresh_dirty_counters(self):
+        dirty = set()
+        while self._counters_dirty:
+            # pop one at a time: the watchdog thread may still be adding ids
+            dirty.add(self._counters_dirty.pop())
         for item in self.items:
-            self.update_mod_counter(item)
+            if item["id"] in dirty:
+                self.update_mod_counter(item)
 
     def update_mod_counter(self,item):
-        folder_path = os.path.join(settings["mod_paths"].get(self.selected_game, default_mod_paths[self.selected_game]),
-                                   self.selected_category, item["id"])
+        folder_path = item["_folder"]
         count = 0
         enabled_count = 0
-        if os.path.exists(folder_path):
-            try:
-                subfolders = [f for f in os.listdir(folder_path) if os.path.isdir(os.path.join(folder_path,f))]
-            except Exception:
-                subfolders = []
-            count = len(subfolders)
-            enabled_count = len([f for f in subfolders if not f.startswith("DISABLED_")])
+        try:
+            mtime = os.stat(folder_path).st_mtime_ns
+        except OSError:
+            mtime = None  # missing/unreadable folder counts as no mods
+        if mtime is not None:
+            # adding, removing or renaming a mod subfolder bumps the folder mtime,
+            # so an unchanged mtime means the cached counts are still valid
+            cached = item.get("_scan")
+            if cached and cached[:2] == (folder_path, mtime):
+                count, enabled_count = cached[2:]
+            else:
+                try:
+                    with os.scandir(folder_path) as it:
+                        for entry in it:
+                            if entry.is_dir():
+                                count += 1
+                                if not entry.name.startswith("DISABLED_"):
+                                    enabled_count += 1
+                except OSError:
+                    pass
+                item["_scan"] = (folder_path, mtime, count, enabled_count)
 
         # Update counter
         if '_counter_label' in item:
@@ -533,12 +951,10 @@ class ModManager(QWidget):
                 item['_warning_label'].setText("")
 
     # -------------------- SELECT MOD --------------------
-    def select_mod(self,list_item):
-        self.selected_mod_path = list_item.data(Qt.ItemDataRole.UserRole)
-        # Highlight selection
-        for i in range(self.mod_list_widget.count()):
-            self.mod_list_widget.item(i).setBackground(Qt.GlobalColor.transparent)
-        list_item.setBackground(Qt.GlobalColor.lightGray)
+    def select_mod(self):
+        # highlighting is done by the QListWidget::item:selected stylesheet rule
+        selected = self.mod_list_widget.selectedItems()
+        self.selected_mod_path = selected[0].data(Qt.ItemDataRole.UserRole) if selected else None
 
     # -------------------- TOGGLE MOD --------------------
     def toggle_selected_mod(self):
@@ -548,26 +964,31 @@ class ModManager(QWidget):
         parent_folder = os.path.dirname(self.selected_mod_path)
         folder_name = os.path.basename(self.selected_mod_path)
         if folder_name.startswith("DISABLED_"):
-            new_name = folder_name.replace("DISABLED_", "", 1)
+            new_name = folder_name.removeprefix("DISABLED_")
         else:
             new_name = f"DISABLED_{folder_name}"
         new_path = os.path.join(parent_folder, new_name)
+        # rename off the UI thread; slow or network disks would otherwise freeze the window
+        threading.Thread(target=self._rename_mod, args=(self.selected_mod_path, new_path), daemon=True).start()
+
+    def _rename_mod(self, old_path, new_path):
         try:
-            os.rename(self.selected_mod_path, new_path)
-            self.selected_mod_path = new_path
+            os.replace(old_path, new_path)
         except Exception as e:
             print(f"Failed to rename folder: {e}")
+            new_path = old_path
+        self.mod_renamed.emit(new_path)
+
+    def on_mod_renamed(self, new_path):
+        # load_mods reselects it, so the toggled mod stays selected
+        self.selected_mod_path = new_path
         self.load_mods()
 
     # -------------------- OPEN FOLDER --------------------
     def open_selected_folder(self):
         if not self.selected_item:
             return
-        folder = os.path.join(
-            settings["mod_paths"].get(self.selected_game, default_mod_paths[self.selected_game]),
-            self.selected_category,
-            self.selected_item["id"]
-        )
+        folder = self.selected_item["_folder"]
         if os.path.exists(folder):
             open_folder(folder)
 
@@ -578,23 +999,11 @@ class ModManager(QWidget):
         save_settings()
 
     def apply_theme(self):
-        if settings.get("theme","dark")=="dark":
-            self.setStyleSheet("""
-                QWidget { background-color: #222; color: #eee; }
-                QScrollArea { background-color: #222; }
-                QTabWidget::pane { background: #222; }
-                QLabel, QPushButton, QComboBox, QListWidget { color: #eee; }
-                QListWidget::item:selected { background-color: #555555; color: #ffffff; }
-            """)
-        else:
-            self.setStyleSheet("""
-                QWidget { background-color: #d3d3d3; color: #222; }  /* Light gray background */
-                QScrollArea { background-color: #d3d3d3; }
-                QTabWidget::pane { background: #ccc; }
-                QLabel, QPushButton, QComboBox { color: #222; }
-                QListWidget { background-color: #444444; color: #ffffff; } /* Dark gray mod list */
-                QListWidget::item:selected { background-color: #666666; color: #ffffff; }
-            """)
+        theme = settings.get("theme","dark")
+        if theme == self._applied_theme:
+            return  # setStyleSheet re-polishes every widget; skip when nothing changes
+        self.setStyleSheet(DARK_QSS if theme=="dark" else LIGHT_QSS)
+        self._applied_theme = theme
 
     def closeEvent(self,event):
         try:
@@ -602,19 +1011,26 @@ class ModManager(QWidget):
             self.observer.join(timeout=1)
         except Exception:
             pass
+        # drop queued update work; the worker is a daemon, so a running download can't hold up exit
+        self.update_executor.shutdown()
         event.accept()
 
     # -------------------- UPDATE CHECKS & UI --------------------
     def check_updates_manual(self):
         # manual check triggered from settings button
-        threading.Thread(target=self._check_updates_and_update_ui, daemon=True).start()
+        self.update_executor.submit(self._check_updates_and_update_ui)
 
     def check_updates_background(self):
-        if settings.get("auto_check_updates", False):
-            threading.Thread(target=self._check_updates_and_update_ui, daemon=True).start()
-        else:
-            # still do one check silently on startup to set dot
-            threading.Thread(target=self._check_updates_and_update_ui, daemon=True).start()
+        last_check = settings.get("last_update_check") or 0
+        if not settings.get("auto_check_updates", False) or time.time() - last_check < UPDATE_CHECK_INTERVAL:
+            # no network on startup: show what the last check found
+            tag = settings.get("last_release_tag")
+            if tag:
+                self.show_release_status(tag)
+            else:
+                self.set_update_status(False, "Not checked")
+            return
+        self.update_executor.submit(self._check_updates_and_update_ui)
 
     def _check_updates_and_update_ui(self):
         latest = fetch_latest_release_info()
@@ -623,27 +1039,30 @@ class ModManager(QWidget):
             self.set_update_status(False, "Unable to check")
             return
         tag = latest.get("tag_name") or latest.get("name")
+        settings["last_release_tag"] = tag
+        settings["last_update_check"] = time.time()
+        save_settings()
+        self.show_release_status(tag)
+
+    def show_release_status(self, tag):
         tag_norm = semver_normalize(tag)
         installed = semver_normalize(settings.get("version", SCRIPT_VERSION))
         if tag_norm and installed and is_version_newer(installed, tag_norm):
-            settings["last_release_tag"] = tag
-            save_settings()
             self.set_update_status(True, f"Update available ({tag})")
         else:
             # no update
-            settings["last_release_tag"] = tag
-            save_settings()
             self.set_update_status(False, "Up to date")
 
     def set_update_status(self, available: bool, label_text: str):
-        # must call from main thread — use QTimer.singleShot to schedule
-        def _apply():
-            if available:
-                self.update_dot.setStyleSheet("color: green; font-weight: bold;")
-            else:
-                self.update_dot.setStyleSheet("color: red; font-weight: bold;")
-            self.update_label.setText(label_text)
-        QTimer.singleShot(0, _apply)
+        # safe from any thread: the signal delivers to the GUI thread
+        self.update_status_changed.emit(available, label_text)
+
+    def _apply_update_status(self, available, label_text):
+        if available:
+            self.update_dot.setStyleSheet("color: green; font-weight: bold;")
+        else:
+            self.update_dot.setStyleSheet("color: red; font-weight: bold;")
+        self.update_label.setText(label_text)
 
     # -------------------- Update Actions (buttons) --------------------
     def launch_update_modmanager(self):
@@ -667,9 +1086,12 @@ class ModManager(QWidget):
             exe_to_run = local_update_path
         else:
             # download the update.exe asset from the latest release
-            threading.Thread(target=self._download_update_exe_and_launch, daemon=True).start()
+            self.update_executor.submit(self._download_update_exe_and_launch)
             return
 
+        self._launch_updater(exe_to_run)
+
+    def _launch_updater(self, exe_to_run):
         # Launch the updater and quit modmanager
         try:
             # spawn updater as detached process
@@ -695,7 +1117,7 @@ class ModManager(QWidget):
         # find update.exe asset by name expected
         download_url = None
         for a in assets:
-            if a.get("name", "").lower() == EXPECTED_UPDATE_EXE_NAME.lower():
+            if a.get("name", "").lower() == UPDATE_EXE_NAME_LOWER:
                 download_url = a.get("browser_download_url")
                 break
         if not download_url:
@@ -708,15 +1130,8 @@ class ModManager(QWidget):
             print("Failed to download update.exe")
             return
 
-        # Launch the new updater and exit
-        try:
-            subprocess.Popen([target], close_fds=True)
-        except Exception as e:
-            print("Failed to start downloaded updater:", e)
-            return
-
-        QApplication.quit()
-        sys.exit(0)
+        # launch and exit from the GUI thread
+        self.updater_downloaded.emit(target)
 
     def update_installer_exe(self):
         """
@@ -755,7 +1170,7 @@ class ModManager(QWidget):
             return
 
         # Otherwise download update.exe and save as update_new.exe
-        threading.Thread(target=self._download_installer_and_swap, daemon=True).start()
+        self.update_executor.submit(self._download_installer_and_swap)
 
     def _download_installer_and_swap(self):
         release = fetch_latest_release_info()
@@ -765,7 +1180,7 @@ class ModManager(QWidget):
         assets = release.get("assets", [])
         download_url = None
         for a in assets:
-            if a.get("name", "").lower() == EXPECTED_UPDATE_EXE_NAME.lower():
+            if a.get("name", "").lower() == UPDATE_EXE_NAME_LOWER:
                 download_url = a.get("browser_download_url")
                 break
         if not download_url:
@@ -776,8 +1191,8 @@ class ModManager(QWidget):
         if not ok:
             print("Failed to download update_new.exe")
             return
-        # now swap
-        self.update_installer_exe()
+        # now swap, back on the GUI thread
+        self.installer_downloaded.emit()
 
 # -------------------- RUN --------------------
 if __name__=="__main__":
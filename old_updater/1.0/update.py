@@ -1,23 +1,32 @@
 import os
 import sys
-import shutil
 import time
 import subprocess
+import ctypes
+from ctypes import wintypes
+
+SYNCHRONIZE = 0x00100000
+BACKOFF = [0.02, 0.05, 0.1, 0.2, 0.5]  # poll delays; the last one repeats
 
 def main():
     base_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
     old_exe = os.path.join(base_dir, "modmanager.exe")
     new_exe = os.path.join(base_dir, "modmanager_new.exe")
 
-    # Wait until the original ModManager closes
-    while os.path.exists(old_exe) and is_file_locked(old_exe):
-        time.sleep(0.5)
+    # Wait until the original ModManager closes. The launcher can pass its PID
+    # as the first argument so we wait on the process itself.
+    if len(sys.argv) > 1 and sys.argv[1].isdigit():
+        wait_for_exit(int(sys.argv[1]))
+    else:
+        for delay in backoff():
+            if not (os.path.exists(old_exe) and is_file_locked(old_exe)):
+                break
+            time.sleep(delay)
 
     try:
-        if os.path.exists(old_exe):
-            os.remove(old_exe)
         if os.path.exists(new_exe):
-            shutil.move(new_exe, old_exe)
+            # same folder, so this is a single rename that overwrites old_exe
+            os.replace(new_exe, old_exe)
     except Exception as e:
         print(f"Failed to update exe: {e}")
         input("Press Enter to exit...")
@@ -27,6 +36,36 @@ def main():
     subprocess.Popen([old_exe], cwd=base_dir)
     sys.exit(0)
 
+def backoff():
+    yield from BACKOFF
+    while True:
+        yield BACKOFF[-1]
+
+def wait_for_exit(pid, timeout=10):
+    """Return once process pid has exited (or after timeout seconds)."""
+    if os.name == "nt":
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        handle = kernel32.OpenProcess(SYNCHRONIZE, False, pid)
+        if not handle:
+            return  # already gone
+        try:
+            kernel32.WaitForSingleObject(handle, int(timeout * 1000))
+        finally:
+            kernel32.CloseHandle(handle)
+        return
+    deadline = time.monotonic() + timeout
+    for delay in backoff():
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return
+        except PermissionError:
+            pass  # exists, owned by someone else
+        if time.monotonic() >= deadline:
+            return
+        time.sleep(delay)
+
 def is_file_locked(filepath):
     """Return True if file is locked (being used)"""
     if not os.path.exists(filepath):
@@ -13,12 +13,23 @@ Features:
 import sys
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import zipfile
 import shutil
 import tempfile
 import subprocess
+import io
 import time
 import json
+import uuid
+import atexit
+import contextlib
+import select
+import threading
+import concurrent.futures
+import ctypes
+from ctypes import wintypes
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
@@ -35,6 +46,29 @@ EXPECTED_RESOURCES_NAME = "resources.zip"
 EXPECTED_UPDATE_NAME = "update.exe"  # optional, used for self update
 DEFAULT_INSTALL_FOLDER_WIN = os.path.join(os.environ.get("ProgramFiles", "C:\\Program Files"), "Mod-Manager")
 CHECK_TIMEOUT = 10  # seconds for network requests
+RELEASE_CACHE_TTL = 60  # seconds a fetched release is reused without asking GitHub again
+BASE_DIR = os.path.dirname(sys.executable if getattr(sys, "frozen", False) else os.path.abspath(__file__))
+RELEASE_CACHE_FILE = os.path.join(BASE_DIR, ".updater-cache.json")
+# extraction is mostly zlib decompression, which releases the GIL: one worker per core
+UNZIP_WORKERS = os.cpu_count() or 1
+# 256 KiB reads keep GIL round-trips per file low (copyfileobj defaults to 64 KiB off Windows)
+COPY_BUFFER_SIZE = 1 << 18
+SMALL_MEMBER_SIZE = 1 << 20  # zip members below this are read whole and written in one go
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB per read when downloading
+PROGRESS_STEP = 512 * 1024  # report every 512 KiB when the size is unknown
+RANGED_DOWNLOAD_MIN = 8 << 20  # assets larger than this are fetched in parallel byte ranges
+RANGED_DOWNLOAD_PARTS = 4
+IN_MEMORY_ZIP_LIMIT = 64 << 20  # resources.zip up to this size is unpacked without touching disk
+
+# One session for the API call and asset downloads so connections are kept alive and reused
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4, pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+SESSION.headers.update({"User-Agent": "Mod-Manager-Updater/1.1"})
 
 # ---------------- Helper functions ----------------
 
@@ -56,61 +90,355 @@ def find_asset_by_name(assets, expected_name):
 
 def download_file(url, dest_path, progress_callback=None):
     """
-    Streams download to dest_path. progress_callback(bytes_downloaded, total_bytes) optional.
+    Streams download to dest_path (a path, or an open binary file such as io.BytesIO).
+    progress_callback(bytes_downloaded, total_bytes) optional, called about once per percent
+    (or every PROGRESS_STEP bytes when the size is unknown).
+    Returns the response's ETag, or None.
     """
-    with requests.get(url, stream=True, timeout=CHECK_TIMEOUT) as r:
+    with SESSION.get(url, stream=True, timeout=CHECK_TIMEOUT) as r:
         r.raise_for_status()
         total = int(r.headers.get('content-length', 0))
+        step = total // 100 if total else PROGRESS_STEP
         downloaded = 0
-        with open(dest_path, 'wb') as f:
-            for chunk in r.iter_content(chunk_size=8192):
+        last_reported = 0
+        to_memory = hasattr(dest_path, "write")
+        with contextlib.nullcontext(dest_path) if to_memory else open(dest_path, 'wb') as f:
+            for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                 if chunk:
                     f.write(chunk)
                     downloaded += len(chunk)
-                    if progress_callback:
+                    if progress_callback and (downloaded - last_reported >= step or downloaded == total):
+                        last_reported = downloaded
                         progress_callback(downloaded, total)
-    return dest_path
+        return r.headers.get('ETag')
+
+class RangeNotSupported(Exception):
+    pass
+
+def download_file_ranged(url, dest_path, progress_callback=None, parts=RANGED_DOWNLOAD_PARTS):
+    """
+    Like download_file, but fetches `parts` byte ranges over separate connections at once.
+    Falls back to a single stream when the server doesn't serve ranges.
+    """
+    head = SESSION.head(url, allow_redirects=True, timeout=CHECK_TIMEOUT)
+    head.raise_for_status()
+    total = int(head.headers.get('content-length', 0))
+    if total < parts or head.headers.get('accept-ranges', '').lower() != 'bytes':
+        return download_file(url, dest_path, progress_callback)
+    # ranges go to the final (redirected) URL so each part skips the redirect
+    final_url = head.url
+
+    with open(dest_path, 'wb') as f:
+        f.truncate(total)
+
+    lock = threading.Lock()
+    state = {"downloaded": 0, "last_reported": 0}
+    step = total // 100
+
+    def fetch(start, end):
+        headers = {"Range": f"bytes={start}-{end}"}
+        with SESSION.get(final_url, headers=headers, stream=True, timeout=CHECK_TIMEOUT) as r:
+            r.raise_for_status()
+            if r.status_code != 206:
+                raise RangeNotSupported()
+            with open(dest_path, 'r+b') as f:
+                f.seek(start)
+                for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if not chunk:
+                        continue
+                    f.write(chunk)
+                    if not progress_callback:
+                        continue
+                    with lock:
+                        state["downloaded"] += len(chunk)
+                        downloaded = state["downloaded"]
+                        if downloaded - state["last_reported"] < step and downloaded != total:
+                            continue
+                        state["last_reported"] = downloaded
+                    progress_callback(downloaded, total)
+
+    size = -(-total // parts)  # ceil
+    ranges = [(start, min(start + size, total) - 1) for start in range(0, total, size)]
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            for f in [pool.submit(fetch, start, end) for start, end in ranges]:
+                f.result()
+    except RangeNotSupported:
+        return download_file(url, dest_path, progress_callback)
+    return head.headers.get('ETag')
+
+def read_etag(path):
+    """ETag saved next to a downloaded file by write_etag, or None."""
+    try:
+        with open(path + ".etag", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+def write_etag(path, etag):
+    try:
+        if etag:
+            with open(path + ".etag", "w", encoding="utf-8") as f:
+                f.write(etag)
+        elif os.path.exists(path + ".etag"):
+            os.remove(path + ".etag")
+    except OSError:
+        pass  # only an optimisation; a missing tag just means a full download next time
+
+def asset_unchanged(url, etag):
+    """True if the server says the asset at url still has this ETag (HEAD + If-None-Match -> 304)."""
+    try:
+        r = SESSION.head(url, headers={"If-None-Match": etag}, allow_redirects=True, timeout=CHECK_TIMEOUT)
+    except requests.RequestException:
+        return False
+    return r.status_code == 304
+
+def _member_target(dest_folder, name):
+    """Path a zip member extracts to, or None if it would land outside dest_folder."""
+    target = os.path.normpath(os.path.join(dest_folder, name))
+    try:
+        if target == dest_folder or os.path.commonpath([dest_folder, target]) != dest_folder:
+            return None
+    except ValueError:  # different drive on Windows
+        return None
+    return target
 
 def unzip_to(zip_path, dest_folder, overwrite=True):
-    with zipfile.ZipFile(zip_path, 'r') as z:
-        # If overwrite: extract all (replace)
-        if overwrite:
-            tempdir = tempfile.mkdtemp()
-            try:
-                z.extractall(tempdir)
-                # copy contents to dest_folder recursively
-                for root, dirs, files in os.walk(tempdir):
-                    rel = os.path.relpath(root, tempdir)
-                    target_root = os.path.join(dest_folder, rel) if rel != '.' else dest_folder
-                    os.makedirs(target_root, exist_ok=True)
-                    for f in files:
-                        src = os.path.join(root, f)
-                        dst = os.path.join(target_root, f)
-                        shutil.copy2(src, dst)
-            finally:
-                shutil.rmtree(tempdir, ignore_errors=True)
-        else:
+    """zip_path may also be the archive's bytes, e.g. a download kept in memory."""
+    if isinstance(zip_path, (bytes, bytearray)):
+        data = zip_path
+        open_zip = lambda: zipfile.ZipFile(io.BytesIO(data), 'r')
+    else:
+        open_zip = lambda: zipfile.ZipFile(zip_path, 'r')
+
+    if not overwrite:
+        with open_zip() as z:
             z.extractall(dest_folder)
+        return
+
+    # If overwrite: extract straight into dest_folder, one member per worker
+    dest_folder = os.path.abspath(dest_folder)
+    members = []
+    with open_zip() as z:
+        for info in z.infolist():
+            target = _member_target(dest_folder, info.filename)
+            if target is None:
+                continue
+            if info.is_dir():
+                os.makedirs(target, exist_ok=True)
+            else:
+                members.append((info.filename, target, info.file_size))
+    # create parent folders up front so workers never race on makedirs
+    for parent in {os.path.dirname(target) for _, target, _ in members}:
+        os.makedirs(parent, exist_ok=True)
+
+    # ZipFile isn't safe to share between threads, so each worker opens its own
+    local = threading.local()
+    handles = []
+    handles_lock = threading.Lock()
+
+    def open_handle():
+        local.zf = open_zip()
+        with handles_lock:
+            handles.append(local.zf)
+
+    def extract(name, target, size):
+        # write beside the target and rename over it, so a failed update never
+        # leaves a truncated file where the previous good one was
+        partial = target + ".partial"
+        try:
+            if size < SMALL_MEMBER_SIZE:
+                # small files: one read, one unbuffered write
+                data = memoryview(local.zf.read(name))
+                fd = os.open(partial, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+                try:
+                    while data:
+                        data = data[os.write(fd, data):]
+                finally:
+                    os.close(fd)
+            else:
+                with local.zf.open(name) as src, open(partial, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+            os.replace(partial, target)
+        except BaseException:
+            try:
+                os.remove(partial)
+            except OSError:
+                pass
+            raise
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=UNZIP_WORKERS, initializer=open_handle) as pool:
+            futures = [pool.submit(extract, *member) for member in members]
+            for f in futures:
+                f.result()
+    finally:
+        for zf in handles:
+            zf.close()
+
+def copy_file(src, dst):
+    """
+    Copy src over dst, letting the OS move the bytes: CopyFileW on Windows; elsewhere
+    shutil.copy2, which already uses sendfile (Linux) / fcopyfile (macOS).
+    """
+    if os.name == "nt":
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        if not kernel32.CopyFileW(str(src), str(dst), False):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return dst
+    return shutil.copy2(src, dst)
 
 def ensure_dir(p):
     os.makedirs(p, exist_ok=True)
     return p
 
-def is_modmanager_running():
-    # Try platform-specific checks
-    name = "modmanager.exe" if os.name == "nt" else "modmanager"
-    if os.name == "nt":
-        try:
-            out = subprocess.check_output(["tasklist", "/FI", f"IMAGENAME eq {name}"], text=True)
-            return name.lower() in out.lower()
-        except Exception:
-            return False
-    else:
+class PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("cntUsage", wintypes.DWORD),
+        ("th32ProcessID", wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", wintypes.DWORD),
+        ("cntThreads", wintypes.DWORD),
+        ("th32ParentProcessID", wintypes.DWORD),
+        ("pcPriClassBase", wintypes.LONG),
+        ("dwFlags", wintypes.DWORD),
+        ("szExeFile", wintypes.WCHAR * 260),
+    ]
+
+TH32CS_SNAPPROCESS = 0x00000002
+
+def _modmanager_pids_win(name):
+    # walk the process list with Toolhelp32 instead of spawning tasklist
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not snapshot or snapshot == wintypes.HANDLE(-1).value:
+        return []
+    pids = []
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        ok = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while ok:
+            if entry.szExeFile.lower() == name:
+                pids.append(entry.th32ProcessID)
+            ok = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+    return pids
+
+def _modmanager_pids_posix(name):
+    # same match as `pgrep -f`: name anywhere in the command line
+    if not os.path.isdir("/proc"):
         try:
             out = subprocess.check_output(["pgrep", "-f", name], text=True)
-            return bool(out.strip())
+            return [int(p) for p in out.split()]
         except Exception:
+            return []
+    me = os.getpid()
+    pids = []
+    with os.scandir("/proc") as it:
+        for entry in it:
+            if not entry.name.isdigit() or int(entry.name) == me:
+                continue
+            try:
+                with open(entry.path + "/cmdline", "rb") as f:
+                    cmdline = f.read().replace(b"\0", b" ").decode(errors="replace")
+            except OSError:
+                continue
+            if name in cmdline:
+                pids.append(int(entry.name))
+    return pids
+
+def find_modmanager_pids():
+    name = "modmanager.exe" if os.name == "nt" else "modmanager"
+    try:
+        if os.name == "nt":
+            return _modmanager_pids_win(name)
+        return _modmanager_pids_posix(name)
+    except Exception:
+        return []
+
+def is_modmanager_running():
+    return bool(find_modmanager_pids())
+
+SYNCHRONIZE = 0x00100000
+REPLACEFILE_WRITE_THROUGH = 0x00000001
+MOVEFILE_REPLACE_EXISTING = 0x00000001
+MOVEFILE_DELAY_UNTIL_REBOOT = 0x00000004
+WAIT_FAILED = 0xFFFFFFFF
+WAIT_TIMEOUT = 0x00000102
+
+def _wait_pids_win(pids, timeout):
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+    handles = [h for h in (kernel32.OpenProcess(SYNCHRONIZE, False, pid) for pid in pids) if h]
+    if not handles:
+        return True  # every process already exited
+    try:
+        # MAXIMUM_WAIT_OBJECTS is 64; more Mod-Manager instances than that isn't a real case
+        handles = handles[:64]
+        arr = (wintypes.HANDLE * len(handles))(*handles)
+        res = kernel32.WaitForMultipleObjects(len(handles), arr, True, int(timeout * 1000))
+        if res == WAIT_FAILED:
+            raise ctypes.WinError(ctypes.get_last_error())
+        return res != WAIT_TIMEOUT
+    finally:
+        for h in handles:
+            kernel32.CloseHandle(h)
+
+def _wait_pids_linux(pids, timeout):
+    fds = []
+    try:
+        for pid in pids:
+            try:
+                fds.append(os.pidfd_open(pid))
+            except ProcessLookupError:
+                pass
+        poller = select.poll()
+        for fd in fds:
+            poller.register(fd, select.POLLIN)  # readable once the process exits
+        deadline = time.monotonic() + timeout
+        remaining = len(fds)
+        while remaining:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                return False
+            for fd, _ in poller.poll(left * 1000):
+                poller.unregister(fd)
+                remaining -= 1
+        return True
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+def wait_for_modmanager_exit(timeout=6):
+    """
+    Block until running Mod-Manager processes exit or timeout seconds pass; True if they exited.
+    Waits on the processes themselves (process handles on Windows, pidfds on Linux) so the
+    wait ends as soon as they are gone; elsewhere it polls with backoff.
+    """
+    pids = find_modmanager_pids()
+    if not pids:
+        return True
+    try:
+        if os.name == "nt":
+            return _wait_pids_win(pids, timeout)
+        if hasattr(os, "pidfd_open"):
+            return _wait_pids_linux(pids, timeout)
+    except OSError:
+        pass  # e.g. no pidfd support in this kernel; poll instead
+
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while is_modmanager_running():
+        if time.monotonic() >= deadline:
             return False
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+    return True
 
 def kill_modmanager():
     name = "modmanager.exe" if os.name == "nt" else "modmanager"
@@ -128,15 +456,16 @@ def kill_modmanager():
             return False
 
 def atomic_replace(src, dst):
-    # Replace dst with src atomically (move)
+    # Replace dst with src in one rename (MoveFileEx / rename(2)); dst never goes missing
     try:
-        if os.path.exists(dst):
-            os.remove(dst)
-        shutil.move(src, dst)
+        os.replace(src, dst)
         return True
-    except Exception:
+    except OSError as e:
+        # access denied / sharing violation: fall back to copying over the file
+        if getattr(e, "winerror", None) not in (5, 32):
+            return False
         try:
-            shutil.copy2(src, dst)
+            copy_file(src, dst)
             os.remove(src)
             return True
         except Exception:
@@ -152,13 +481,52 @@ def run_and_detach(path, args=[]):
 
 # ---------------- GitHub release helpers ----------------
 
+# ts is None until this process has fetched (or revalidated) the release itself;
+# monotonic() can be smaller than the TTL right after boot, so 0.0 would read as fresh
+_release_cache = {"ts": None, "etag": None, "data": None}
+
+def _load_release_cache():
+    # the last release + ETag from a previous run; only used to send If-None-Match
+    try:
+        with open(RELEASE_CACHE_FILE, "r", encoding="utf-8") as f:
+            stored = json.load(f)
+        _release_cache.update(etag=stored.get("etag"), data=stored.get("data"))
+    except (OSError, ValueError, AttributeError):
+        pass
+
+def _save_release_cache():
+    tmp = RELEASE_CACHE_FILE + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"etag": _release_cache["etag"], "data": _release_cache["data"]}, f)
+        os.replace(tmp, RELEASE_CACHE_FILE)
+    except OSError:
+        pass  # e.g. read-only install folder; the in-memory cache still works
+
+_load_release_cache()
+
 def get_latest_release_info():
     """
     Returns dict of latest release info from GitHub API or raises on error.
+    Repeat calls within RELEASE_CACHE_TTL reuse the last answer; after that the request
+    carries If-None-Match, so an unchanged release comes back as an empty 304.
     """
-    r = requests.get(GITHUB_API_LATEST, timeout=CHECK_TIMEOUT, headers={"Accept":"application/vnd.github.v3+json"})
+    cached = _release_cache["data"]
+    fetched_at = _release_cache["ts"]
+    if cached is not None and fetched_at is not None and time.monotonic() - fetched_at < RELEASE_CACHE_TTL:
+        return cached
+    headers = {"Accept":"application/vnd.github.v3+json"}
+    if cached is not None and _release_cache["etag"]:
+        headers["If-None-Match"] = _release_cache["etag"]
+    r = SESSION.get(GITHUB_API_LATEST, timeout=CHECK_TIMEOUT, headers=headers)
+    if r.status_code == 304 and cached is not None:
+        _release_cache["ts"] = time.monotonic()
+        return cached
     r.raise_for_status()
-    return r.json()
+    data = r.json()
+    _release_cache.update(ts=time.monotonic(), etag=r.headers.get("ETag"), data=data)
+    _save_release_cache()
+    return data
 
 # ---------------- Worker thread for network ops ----------------
 
@@ -183,6 +551,9 @@ class WorkerThread(QThread):
 # ---------------- GUI ----------------
 
 class UpdaterGUI(QWidget):
+    # Download percent; emitted from download and range threads, applied on the GUI thread
+    percent = pyqtSignal(int)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Mod-Manager Installer / Updater")
@@ -190,6 +561,11 @@ class UpdaterGUI(QWidget):
         self.install_path = DEFAULT_INSTALL_FOLDER_WIN if os.name == "nt" else os.path.join(str(Path.home()), "Mod-Manager")
         self.latest_release = None
         self.assets = []
+        self._asset_index = {}  # normalize_asset_name(name) -> asset
+        self._etags = {}  # downloaded file path -> ETag it was served with
+        # scratch space shared by every task this session; removed on exit
+        self._session_tmp = tempfile.mkdtemp(prefix="modmgr-")
+        atexit.register(shutil.rmtree, self._session_tmp, ignore_errors=True)
         self.init_ui()
 
     def init_ui(self):
@@ -236,6 +612,7 @@ class UpdaterGUI(QWidget):
         self.progress_bar.setRange(0, 0)  # indeterminate until progress emitted
         self.progress_bar.setVisible(False)
         layout.addWidget(self.progress_bar)
+        self.percent.connect(self.on_percent)
 
         self.log_label = QLabel("")
         self.log_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
@@ -284,6 +661,10 @@ class UpdaterGUI(QWidget):
         self.log_label.setText(msg)
         # If msg includes "progress: x/y" we could update bar, but keep indeterminate for simplicity
 
+    def on_percent(self, pct):
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(pct)
+
     def on_finished(self, success, message):
         self.progress_bar.setVisible(False)
         self.progress_bar.setRange(0, 100)
@@ -295,103 +676,151 @@ class UpdaterGUI(QWidget):
 
     # -------------------- Tasks --------------------
 
+    def _task_tempdir(self):
+        tempdir = os.path.join(self._session_tmp, uuid.uuid4().hex)
+        os.mkdir(tempdir)
+        return tempdir
+
+    def _set_release(self, info):
+        self.latest_release = info
+        self.assets = info.get("assets", [])
+        self._asset_index = {normalize_asset_name(a.get("name", "")): a for a in self.assets}
+
+    def _find_asset(self, expected_name):
+        # exact name from the index; substring match only as a fallback
+        return self._asset_index.get(normalize_asset_name(expected_name)) or find_asset_by_name(self.assets, expected_name)
+
     def task_check_latest(self, progress):
         progress.emit("Querying GitHub API for latest release...")
         info = get_latest_release_info()
-        self.latest_release = info
-        assets = info.get("assets", [])
-        self.assets = assets
+        self._set_release(info)
+        assets = self.assets
         names = ", ".join([a.get("name", "") for a in assets])
         progress.emit(f"Latest release: {info.get('tag_name', '')}. Assets: {names}")
         return f"Latest: {info.get('tag_name', '')}"
 
-    def _download_asset_by_expected(self, expected_name, dest_file, progress):
+    def _download_asset_by_expected(self, expected_name, dest_file, progress, progress_callback=None):
         # ensure latest_release loaded
         if not self.latest_release:
             progress.emit("Fetching latest release info...")
-            self.latest_release = get_latest_release_info()
-            self.assets = self.latest_release.get("assets", [])
-        asset = find_asset_by_name(self.assets, expected_name)
+            self._set_release(get_latest_release_info())
+        asset = self._find_asset(expected_name)
         if not asset:
             raise FileNotFoundError(f"Asset '{expected_name}' not found in release assets.")
         url = asset.get("browser_download_url")
         progress.emit(f"Downloading {asset.get('name')} ...")
         # Use streaming download and update progress
+        last_pct = [-1]
         def cb(downloaded, total):
             if total:
                 pct = int(downloaded * 100 / total)
-                self.progress_bar.setRange(0,100)
-                self.progress_bar.setValue(pct)
-        download_file(url, dest_file, progress_callback=cb)
+                if pct == last_pct[0]:
+                    return
+                last_pct[0] = pct
+                self.percent.emit(pct)
+        if not hasattr(dest_file, "write") and asset.get("size", 0) > RANGED_DOWNLOAD_MIN:
+            etag = download_file_ranged(url, dest_file, progress_callback=progress_callback or cb)
+        else:
+            etag = download_file(url, dest_file, progress_callback=progress_callback or cb)
+        if not hasattr(dest_file, "write"):
+            self._etags[dest_file] = etag
         return dest_file
 
+    def _download_assets(self, targets, progress, after=None):
+        """
+        Download several assets at the same time. targets is a list of (expected_name, dest_file).
+        after optionally maps an expected_name to fn(dest_file), run on that asset's worker as soon
+        as its own download finishes (e.g. unpack resources while the exe is still downloading).
+        The progress bar shows the combined percentage once every size is known.
+        """
+        after = after or {}
+        lock = threading.Lock()
+        done = {}
+        totals = {}
+
+        def make_cb(name):
+            def cb(downloaded, total):
+                with lock:
+                    done[name] = downloaded
+                    totals[name] = total
+                    if len(totals) < len(targets) or not all(totals.values()):
+                        return
+                    pct = int(sum(done.values()) * 100 / sum(totals.values()))
+                self.percent.emit(pct)
+            return cb
+
+        def fetch(name, dest):
+            self._download_asset_by_expected(name, dest, progress, make_cb(name))
+            if name in after:
+                after[name](dest)
+            return dest
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(targets)) as pool:
+            futures = [pool.submit(fetch, name, dest) for name, dest in targets]
+            # result() re-raises the first download error
+            return [f.result() for f in futures]
+
     def task_install(self, progress):
         # Steps:
         # 1) get latest release info
         progress.emit("Fetching latest release info...")
         info = get_latest_release_info()
-        self.latest_release = info
-        self.assets = info.get("assets", [])
+        self._set_release(info)
         tag = info.get("tag_name", "unknown")
         progress.emit(f"Latest release: {tag}")
 
-        tempdir = tempfile.mkdtemp()
+        install_root = os.path.abspath(self.install_path)
+        dest_mod = os.path.join(install_root, EXPECTED_MODMANAGER_NAME)
+        # the exe lands next to its final path, so moving it in is a same-volume rename
+        mod_dest = dest_mod + ".new"
+        tempdir = self._task_tempdir()
         try:
-            # 2) download modmanager.exe
-            mod_dest = os.path.join(tempdir, EXPECTED_MODMANAGER_NAME)
-            self._download_asset_by_expected(EXPECTED_MODMANAGER_NAME, mod_dest, progress)
-
-            # 3) download resources.zip
-            res_dest = os.path.join(tempdir, EXPECTED_RESOURCES_NAME)
-            self._download_asset_by_expected(EXPECTED_RESOURCES_NAME, res_dest, progress)
-
-            # 4) ensure install folder and resources folder
-            install_root = os.path.abspath(self.install_path)
+            # 2) ensure install folder and resources folder
             if not os.path.exists(install_root):
                 os.makedirs(install_root, exist_ok=True)
             resources_folder = os.path.join(install_root, "resources")
             os.makedirs(resources_folder, exist_ok=True)
 
+            # 3) + 4) download modmanager.exe and resources.zip in parallel;
+            # resources.zip is unpacked as soon as it lands, overlapping the exe download
+            def unpack_resources(zip_path):
+                progress.emit("Unpacking resources...")
+                unzip_to(zip_path, resources_folder, overwrite=True)
+
+            res_dest = os.path.join(tempdir, EXPECTED_RESOURCES_NAME)
+            self._download_assets([
+                (EXPECTED_MODMANAGER_NAME, mod_dest),
+                (EXPECTED_RESOURCES_NAME, res_dest),
+            ], progress, after={EXPECTED_RESOURCES_NAME: unpack_resources})
+
             # 5) stop running modmanager
             progress.emit("Attempting to stop running Mod-Manager (if any)...")
             if is_modmanager_running():
                 progress.emit("Mod-Manager is running; attempting to terminate...")
                 kill_modmanager()
                 # wait up to 6 seconds
-                for i in range(12):
-                    if not is_modmanager_running():
-                        break
-                    time.sleep(0.5)
+                wait_for_modmanager_exit(timeout=6)
 
             # 6) move modmanager.exe into place
-            dest_mod = os.path.join(install_root, EXPECTED_MODMANAGER_NAME)
             progress.emit(f"Installing {EXPECTED_MODMANAGER_NAME} ...")
-            if os.path.exists(dest_mod):
-                try:
-                    os.remove(dest_mod)
-                except Exception:
-                    pass
-            shutil.copy2(mod_dest, dest_mod)
+            os.replace(mod_dest, dest_mod)
+            write_etag(dest_mod, self._etags.pop(mod_dest, None))
 
-            # 7) unzip resources.zip into resources folder
-            progress.emit("Unpacking resources...")
-            unzip_to(res_dest, resources_folder, overwrite=True)
-
-            # 8) copy this updater to install folder as update.exe
+            # 7) copy this updater to install folder as update.exe
             progress.emit("Copying updater into install folder...")
             exe_src = sys.executable if getattr(sys, "frozen", False) else __file__
             # if running as script, copy the script; recommend building exe for production
             updater_dst = os.path.join(install_root, EXPECTED_UPDATE_NAME)
             try:
-                shutil.copy2(exe_src, updater_dst)
+                copy_file(exe_src, updater_dst)
             except Exception:
                 # try to copy the current script's path
                 try:
-                    shutil.copy2(__file__, updater_dst)
+                    copy_file(__file__, updater_dst)
                 except Exception as e:
                     progress.emit(f"Warning copying updater: {e}")
 
-            # 9) create shortcut? (optional - not implemented)
+            # 8) create shortcut? (optional - not implemented)
             progress.emit(f"Installed to {install_root}.")
             # Launch installed modmanager
             progress.emit("Launching Mod-Manager...")
@@ -399,89 +828,95 @@ class UpdaterGUI(QWidget):
             return f"Installed Mod-Manager {tag} to {install_root}"
         finally:
             shutil.rmtree(tempdir, ignore_errors=True)
+            # only left behind if the install failed before the swap
+            if os.path.exists(mod_dest):
+                try:
+                    os.remove(mod_dest)
+                except OSError:
+                    pass
 
     def task_update_exe(self, progress):
         # Download new modmanager.exe and replace existing; restart modmanager
         progress.emit("Preparing to update modmanager.exe...")
         info = get_latest_release_info()
-        self.latest_release = info
-        self.assets = info.get("assets", [])
-        tempdir = tempfile.mkdtemp()
+        self._set_release(info)
+        install_root = os.path.abspath(self.install_path)
+        dest_mod = os.path.join(install_root, EXPECTED_MODMANAGER_NAME)
+        if not os.path.exists(dest_mod):
+            raise FileNotFoundError(f"No existing modmanager at {dest_mod} — consider using Install first.")
+
+        # same ETag as the installed copy: nothing to download
+        asset = self._find_asset(EXPECTED_MODMANAGER_NAME)
+        etag = read_etag(dest_mod)
+        if asset and etag and asset_unchanged(asset.get("browser_download_url"), etag):
+            return "modmanager.exe is already up to date."
+
+        # download beside the installed exe so the swap below is a same-volume rename
+        tmp_target = dest_mod + ".new"
+        self._download_asset_by_expected(EXPECTED_MODMANAGER_NAME, tmp_target, progress)
         try:
-            mod_dest = os.path.join(tempdir, EXPECTED_MODMANAGER_NAME)
-            self._download_asset_by_expected(EXPECTED_MODMANAGER_NAME, mod_dest, progress)
-
-            install_root = os.path.abspath(self.install_path)
-            dest_mod = os.path.join(install_root, EXPECTED_MODMANAGER_NAME)
-            if not os.path.exists(dest_mod):
-                raise FileNotFoundError(f"No existing modmanager at {dest_mod} — consider using Install first.")
-
             # Kill running modmanager
             if is_modmanager_running():
                 progress.emit("Stopping running Mod-Manager...")
                 kill_modmanager()
-                for i in range(12):
-                    if not is_modmanager_running():
-                        break
-                    time.sleep(0.5)
+                wait_for_modmanager_exit(timeout=6)
 
             progress.emit("Replacing modmanager.exe ...")
             # Atomic replace
-            tmp_target = dest_mod + ".new"
-            try:
-                if os.path.exists(tmp_target):
-                    os.remove(tmp_target)
-            except Exception:
-                pass
-            shutil.copy2(mod_dest, tmp_target)
-            # Move into place
-            if os.path.exists(dest_mod):
-                try:
-                    os.remove(dest_mod)
-                except Exception:
-                    pass
-            shutil.move(tmp_target, dest_mod)
+            os.replace(tmp_target, dest_mod)
+            write_etag(dest_mod, self._etags.pop(tmp_target, None))
+            updater_note = ""
             # optionally update updater too if present in release
-            update_asset = find_asset_by_name(self.assets, EXPECTED_UPDATE_NAME)
+            update_asset = self._find_asset(EXPECTED_UPDATE_NAME)
             if update_asset:
                 progress.emit("Downloading new updater (update.exe) for self-update...")
-                upd_tmp = os.path.join(tempdir, EXPECTED_UPDATE_NAME)
-                self._download_asset_by_expected(EXPECTED_UPDATE_NAME, upd_tmp, progress)
-                # replace update.exe in install folder via helper (because this updater may be the same file)
                 installed_updater = os.path.join(install_root, EXPECTED_UPDATE_NAME)
+                # write new file to installed_updater.new, next to where it ends up
+                tmp_up = installed_updater + ".new"
+                self._download_asset_by_expected(EXPECTED_UPDATE_NAME, tmp_up, progress)
+                # replace update.exe in install folder via helper (because this updater may be the same file)
                 if os.path.exists(installed_updater):
                     progress.emit("Replacing installed updater...")
-                    # write new file to installed_updater.new then schedule replacement
-                    tmp_up = installed_updater + ".new"
-                    shutil.copy2(upd_tmp, tmp_up)
-                    # Use batch/shell to move after exit
-                    self._schedule_replace_and_exit(tmp_up, installed_updater)
-                    # This will exit this process to let replacement happen
-                    return "Updater replacement scheduled; exiting to finish update."
+                    updater_note = " " + self._replace_running_updater(tmp_up, installed_updater)
                 else:
-                    # just copy over
-                    shutil.copy2(upd_tmp, installed_updater)
+                    # just move into place
+                    os.replace(tmp_up, installed_updater)
             progress.emit("Starting updated Mod-Manager...")
             run_and_detach(dest_mod, [])
-            return "Mod-Manager executable updated and launched."
+            return "Mod-Manager executable updated and launched." + updater_note
         finally:
-            shutil.rmtree(tempdir, ignore_errors=True)
+            # only left behind if the swap didn't happen
+            if os.path.exists(tmp_target):
+                try:
+                    os.remove(tmp_target)
+                except OSError:
+                    pass
 
     def task_update_resources(self, progress):
         progress.emit("Preparing to update resources...")
         info = get_latest_release_info()
-        self.latest_release = info
-        self.assets = info.get("assets", [])
-        tempdir = tempfile.mkdtemp()
+        self._set_release(info)
+
+        install_root = os.path.abspath(self.install_path)
+        resources_folder = os.path.join(install_root, "resources")
+        if not os.path.exists(resources_folder):
+            os.makedirs(resources_folder, exist_ok=True)
+
+        # small archives are unpacked straight from memory, skipping the temp file write + read
+        asset = self._find_asset(EXPECTED_RESOURCES_NAME)
+        if asset and 0 < asset.get("size", 0) <= IN_MEMORY_ZIP_LIMIT:
+            buf = io.BytesIO()
+            self._download_asset_by_expected(EXPECTED_RESOURCES_NAME, buf, progress)
+            progress.emit("Unpacking resources...")
+            unzip_to(buf.getvalue(), resources_folder, overwrite=True)
+            progress.emit("Resources updated.")
+            return "Resources updated."
+
+        tempdir = self._task_tempdir()
         try:
             res_dest = os.path.join(tempdir, EXPECTED_RESOURCES_NAME)
             self._download_asset_by_expected(EXPECTED_RESOURCES_NAME, res_dest, progress)
 
-            install_root = os.path.abspath(self.install_path)
-            resources_folder = os.path.join(install_root, "resources")
-            if not os.path.exists(resources_folder):
-                os.makedirs(resources_folder, exist_ok=True)
-
             progress.emit("Unpacking resources...")
             unzip_to(res_dest, resources_folder, overwrite=True)
 
@@ -491,63 +926,28 @@ class UpdaterGUI(QWidget):
         finally:
             shutil.rmtree(tempdir, ignore_errors=True)
 
-    def _schedule_replace_and_exit(self, new_file_path, target_path):
+    def _replace_running_updater(self, new_file_path, target_path):
         """
-        Schedule replacement of target_path by new_file_path after this process exits.
-        For Windows: create a small batch that waits for process to exit then moves file.
-        For POSIX: create a shell script to do the same.
-        Then launch it detached and exit current process.
+        Swap target_path (possibly this running updater) for new_file_path; returns a status note.
+        POSIX can rename over a running executable. Windows can't overwrite a running image but
+        can rename it, so ReplaceFileW moves the old one aside to .old; if that fails too, the
+        move is queued with MoveFileExW for the next reboot.
         """
-        progress_text = f"Scheduling replacement of {target_path}"
-        # Windows batch approach
-        if os.name == "nt":
-            bat = tempfile.mktemp(suffix=".bat")
-            # The batch will:
-            # - wait until target is unlockable (try to delete it)
-            # - move new_file_path to target_path
-            # - optionally remove itself
-            script = f"""@echo off
-SETLOCAL ENABLEDELAYEDEXPANSION
-REM wait loop
-ping 127.0.0.1 -n 2 >nul
-:loop
-del "{target_path}" >nul 2>&1
-if exist "{target_path}" (
-  timeout /t 1 /nobreak >nul
-  goto loop
-)
-move /Y "{new_file_path}" "{target_path}" >nul 2>&1
-del "%~f0" >nul 2>&1
-"""
-            with open(bat, "w", encoding="utf-8") as f:
-                f.write(script)
-            # launch batch detached
-            CREATE_NO_WINDOW = 0x08000000
-            DETACHED_PROCESS = 0x00000008
+        if os.name != "nt":
+            os.replace(new_file_path, target_path)
+            return "Updater replaced."
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        backup = target_path + ".old"
+        if kernel32.ReplaceFileW(target_path, new_file_path, backup, REPLACEFILE_WRITE_THROUGH, None, None):
+            # the old image may still be running: delete it now, or at the next reboot
             try:
-                subprocess.Popen(["cmd.exe", "/C", bat], creationflags=DETACHED_PROCESS)
-            except Exception:
-                subprocess.Popen(["cmd.exe", "/C", bat])
-            # exit current process to allow batch to replace
-            QApplication.instance().quit()
-            sys.exit(0)
-        else:
-            sh = tempfile.mktemp(suffix=".sh")
-            script = f"""#!/bin/sh
-sleep 1
-while [ -e "{target_path}" ]; do
-  rm -f "{target_path}" 2>/dev/null || true
-  sleep 1
-done
-mv "{new_file_path}" "{target_path}" || true
-rm -- "$0"
-"""
-            with open(sh, "w", encoding="utf-8") as f:
-                f.write(script)
-            os.chmod(sh, 0o755)
-            subprocess.Popen(["/bin/sh", sh], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            QApplication.instance().quit()
-            sys.exit(0)
+                os.remove(backup)
+            except OSError:
+                kernel32.MoveFileExW(backup, None, MOVEFILE_DELAY_UNTIL_REBOOT)
+            return "Updater replaced."
+        if kernel32.MoveFileExW(new_file_path, target_path, MOVEFILE_REPLACE_EXISTING | MOVEFILE_DELAY_UNTIL_REBOOT):
+            return "The new updater will be put in place after Windows restarts."
+        raise ctypes.WinError(ctypes.get_last_error())
 
 # ---------------- Main ----------------
 
@@ -1,6 +1,11 @@
 import os, sys, json, shutil, zipfile, requests, subprocess
+import io
+import threading
+import tempfile
+import contextlib
+import concurrent.futures
 from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog, QProgressBar, QMessageBox, QCheckBox
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QThread, pyqtSignal
 
 # -------------------- CONFIG --------------------
 GITHUB_RELEASES = "https://github.com/Sanddino00/Mod-Manager/releases/latest/download"
@@ -12,34 +17,138 @@ INSTALL_JSON = "install_path.json"
 DESKTOP = os.path.join(os.path.join(os.environ['USERPROFILE']), 'Desktop')
 
 # -------------------- HELPERS --------------------
-def download_file(url, path, progress_callback=None):
-    r = requests.get(url, stream=True)
-    total_length = int(r.headers.get('content-length', 0))
-    with open(path, 'wb') as f:
-        dl = 0
-        for data in r.iter_content(chunk_size=4096):
-            f.write(data)
-            dl += len(data)
-            if progress_callback:
-                progress_callback(int(dl / total_length * 100))
+CHUNK_SIZE = 1024 * 1024
+SPOOL_MAX = 64 * 1024 * 1024  # resources.zip stays in RAM up to this size, then spills to a temp file
+EXTRACT_WORKERS = os.cpu_count() or 1
+TAR_EXE = os.path.join(os.environ.get("SystemRoot", r"C:\Windows"), "System32", "tar.exe")
+CREATE_NO_WINDOW = 0x08000000
+
+def download_file(url, path, progress_callback=None, bytes_callback=None):
+    """
+    path may also be an open binary file. progress_callback(percent) when the percent changes;
+    bytes_callback(done, total) per chunk.
+    """
+    with requests.get(url, stream=True, timeout=30) as r:
+        r.raise_for_status()
+        total_length = int(r.headers.get('content-length', 0))
+        with contextlib.nullcontext(path) if hasattr(path, 'write') else open(path, 'wb') as f:
+            if not progress_callback and not bytes_callback:
+                r.raw.decode_content = True
+                shutil.copyfileobj(r.raw, f, length=CHUNK_SIZE)
+                return
+            dl = 0
+            last_pct = -1
+            for data in r.iter_content(chunk_size=CHUNK_SIZE):
+                f.write(data)
+                dl += len(data)
+                if bytes_callback:
+                    bytes_callback(dl, total_length)
+                    continue
+                # no content-length (chunked transfer): nothing to report a percentage of
+                if total_length:
+                    pct = int(dl / total_length * 100)
+                    if pct != last_pct:
+                        last_pct = pct
+                        progress_callback(pct)
+
+def _member_target(extract_to, name):
+    """Path a zip member extracts to, or None if it would land outside extract_to."""
+    target = os.path.normpath(os.path.join(extract_to, name))
+    try:
+        if target == extract_to or os.path.commonpath([extract_to, target]) != extract_to:
+            return None
+    except ValueError:  # different drive on Windows
+        return None
+    return target
+
+def extract_parallel(open_zip, extract_to):
+    """
+    Extract every member, one worker per CPU (zlib inflate releases the GIL).
+    open_zip() must return a fresh ZipFile: a ZipFile can't be shared between threads.
+    Members named outside extract_to (absolute or "../" paths) are skipped.
+    """
+    extract_to = os.path.abspath(extract_to)
+    infos = []
+    parents = set()
+    with open_zip() as zf:
+        for info in zf.infolist():
+            target = _member_target(extract_to, info.filename)
+            if target is None:
+                continue
+            infos.append(info)
+            parents.add(target if info.is_dir() else os.path.dirname(target))
+    # create folders up front so workers never race on makedirs
+    for parent in parents:
+        os.makedirs(parent, exist_ok=True)
+
+    local = threading.local()
+    handles = []
+    lock = threading.Lock()
+
+    def extract_one(info):
+        zf = getattr(local, "zf", None)
+        if zf is None:
+            zf = local.zf = open_zip()
+            with lock:
+                handles.append(zf)
+        zf.extract(info, extract_to)
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as ex:
+            list(ex.map(extract_one, infos))
+    finally:
+        for zf in handles:
+            zf.close()
+
+def extract_with_tar(zip_path, extract_to):
+    """
+    Extract with the tar.exe (bsdtar) bundled in Windows 10 1803+, which reads zip natively
+    and is far faster than zipfile. Returns False if it isn't available or fails.
+    """
+    if os.name != "nt" or not os.path.exists(TAR_EXE):
+        return False
+    os.makedirs(extract_to, exist_ok=True)
+    from_stdin = not isinstance(zip_path, (str, os.PathLike))
+    cmd = [TAR_EXE, "-xf", "-" if from_stdin else os.fspath(zip_path), "-C", extract_to]
+    try:
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE if from_stdin else None,
+                                creationflags=CREATE_NO_WINDOW)
+        if from_stdin:
+            # in-memory / spooled archives are streamed in, never written out as a .zip
+            with proc.stdin:
+                if isinstance(zip_path, (bytes, bytearray)):
+                    proc.stdin.write(zip_path)
+                else:
+                    shutil.copyfileobj(zip_path, proc.stdin, CHUNK_SIZE)
+        return proc.wait() == 0
+    except OSError:
+        return False
 
 def unzip_and_merge(zip_path, extract_to):
-    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        zip_ref.extractall(extract_to)
+    # zip_path: a path, the archive's bytes, or a seekable file object
+    if extract_with_tar(zip_path, extract_to):
+        pass
+    elif isinstance(zip_path, (bytes, bytearray)):
+        extract_parallel(lambda: zipfile.ZipFile(io.BytesIO(zip_path), 'r'), extract_to)
+    elif hasattr(zip_path, 'read'):
+        # one open file can't be read by several workers at once
+        zip_path.seek(0)
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            zip_ref.extractall(extract_to)
+    else:
+        extract_parallel(lambda: zipfile.ZipFile(zip_path, 'r'), extract_to)
+    # an archive that wraps everything in resources/ lands one level too deep: lift its
+    # top-level entries (a few folders, not every file) up with one rename each
     nested_resources = os.path.join(extract_to, 'resources')
-    final_resources = os.path.join(extract_to, 'resources')
-    if os.path.exists(nested_resources):
-        for item in os.listdir(nested_resources):
-            src = os.path.join(nested_resources, item)
-            dst = os.path.join(final_resources, item)
-            if os.path.exists(dst):
-                if os.path.isdir(dst):
-                    shutil.rmtree(dst)
-                else:
-                    os.remove(dst)
-            shutil.move(src, dst)
-        if nested_resources != final_resources:
-            os.rmdir(nested_resources)
+    if os.path.isdir(nested_resources):
+        with os.scandir(nested_resources) as it:
+            entries = list(it)
+        for entry in entries:
+            dst = os.path.join(extract_to, entry.name)
+            if entry.is_dir(follow_symlinks=False) and os.path.isdir(dst):
+                shutil.rmtree(dst)
+            os.replace(entry.path, dst)
+        os.rmdir(nested_resources)
 
 def close_modmanager_win():
     try:
@@ -61,6 +170,104 @@ def create_shortcut(exe_path):
     except Exception as e:
         print(f"Failed to create shortcut: {e}")
 
+# -------------------- WORKER --------------------
+class UpdateWorker(QObject):
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(bool, str)  # success, message
+
+    def __init__(self, install_path, make_shortcut):
+        super().__init__()
+        self.install_path = install_path
+        self.make_shortcut = make_shortcut
+
+    def run(self):
+        try:
+            self.update()
+            self.finished.emit(True, "✅ Finished updating Mod-Manager!")
+        except Exception as e:
+            self.finished.emit(False, f"Update failed: {e}")
+
+    def update(self):
+        os.makedirs(self.install_path, exist_ok=True)
+
+        # -------------------- CLOSE MODMANAGER --------------------
+        close_modmanager_win()
+
+        # move the running exe aside before its replacement starts downloading
+        modmanager_path = os.path.join(self.install_path, MODMANAGER_EXE)
+        old_path = os.path.join(self.install_path, "modmanager_old.exe")
+        # os.replace overwrites a leftover modmanager_old.exe in the same call
+        with contextlib.suppress(FileNotFoundError):
+            os.replace(modmanager_path, old_path)
+
+        # -------------------- DOWNLOAD ASSETS (in parallel) --------------------
+        # resources.zip is spooled in memory (on disk only past SPOOL_MAX) and unpacked as
+        # soon as it arrives, while the exe downloads are still running
+        res_zip = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX)
+
+        def unpack_resources(f):
+            size = f.tell()
+            f.seek(0)
+            # still in RAM: pass the bytes so every extract worker can open its own reader
+            unzip_and_merge(f.read() if size <= SPOOL_MAX else f, os.path.join(self.install_path, 'resources'))
+
+        downloads = [
+            (f"{GITHUB_RELEASES}/{RESOURCES_ZIP}", res_zip, unpack_resources),
+            (f"{GITHUB_RELEASES}/{MODMANAGER_EXE}", modmanager_path, None),
+        ]
+        update_new_path = os.path.join(self.install_path, UPDATE_NEW_EXE)
+        if not os.path.exists(update_new_path):
+            downloads.append((f"{GITHUB_RELEASES}/{UPDATE_EXE}", update_new_path, None))
+        try:
+            self.download_all(downloads)
+        finally:
+            res_zip.close()
+
+        # Delete old modmanager_old.exe
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(old_path)
+
+        # -------------------- SHORTCUT --------------------
+        if self.make_shortcut:
+            create_shortcut(modmanager_path)
+
+        # -------------------- LAUNCH MODMANAGER --------------------
+        subprocess.Popen([modmanager_path])
+
+    def download_all(self, downloads):
+        """
+        downloads: (url, dest, after) tuples; after(dest), if given, runs on the same worker
+        right after that file finishes. Emits the combined percentage when it changes.
+        """
+        sizes = {url: (0, 0) for url, _, _ in downloads}
+        lock = threading.Lock()
+        last_pct = [-1]
+
+        def make_cb(url):
+            def cb(done, total):
+                with lock:
+                    sizes[url] = (done, total)
+                    total_all = sum(t for _, t in sizes.values())
+                    if not total_all or not all(t for _, t in sizes.values()):
+                        return
+                    pct = int(sum(d for d, _ in sizes.values()) / total_all * 100)
+                    if pct == last_pct[0]:
+                        return
+                    last_pct[0] = pct
+                self.progress.emit(pct)
+            return cb
+
+        def fetch(url, dest, after):
+            download_file(url, dest, None, make_cb(url))
+            if after:
+                after(dest)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(downloads)) as executor:
+            futures = [executor.submit(fetch, url, dest, after) for url, dest, after in downloads]
+            for f in futures:
+                f.result()  # re-raises a failed download
+        self.progress.emit(100)
+
 # -------------------- GUI --------------------
 class Updater(QWidget):
     def __init__(self):
@@ -110,43 +317,24 @@ class Updater(QWidget):
         if not self.install_path:
             QMessageBox.warning(self, "Error", "Please select the installation path first.")
             return
-        os.makedirs(self.install_path, exist_ok=True)
-
-        # -------------------- CLOSE MODMANAGER --------------------
-        close_modmanager_win()
 
-        # -------------------- DOWNLOAD RESOURCES --------------------
-        res_zip_path = os.path.join(self.install_path, RESOURCES_ZIP)
-        download_file(f"{GITHUB_RELEASES}/{RESOURCES_ZIP}", res_zip_path, self.progress.setValue)
-        unzip_and_merge(res_zip_path, os.path.join(self.install_path, 'resources'))
-        os.remove(res_zip_path)
+        # network, unzip and process work all run off the GUI thread
+        self.update_btn.setEnabled(False)
+        self.finished_label.setText("Updating...")
+        self.update_thread = QThread(self)
+        self.worker = UpdateWorker(self.install_path, self.shortcut_checkbox.isChecked())
+        self.worker.moveToThread(self.update_thread)
+        self.update_thread.started.connect(self.worker.run)
+        self.worker.progress.connect(self.progress.setValue, Qt.ConnectionType.QueuedConnection)
+        self.worker.finished.connect(self.on_update_finished, Qt.ConnectionType.QueuedConnection)
+        self.worker.finished.connect(self.update_thread.quit)
+        self.update_thread.start()
 
-        # -------------------- DOWNLOAD MODMANAGER.EXE --------------------
-        modmanager_path = os.path.join(self.install_path, MODMANAGER_EXE)
-        old_path = os.path.join(self.install_path, "modmanager_old.exe")
-        if os.path.exists(modmanager_path):
-            if os.path.exists(old_path):
-                os.remove(old_path)
-            os.rename(modmanager_path, old_path)
-
-        download_file(f"{GITHUB_RELEASES}/{MODMANAGER_EXE}", modmanager_path, self.progress.setValue)
-
-        # Delete old modmanager_old.exe
-        if os.path.exists(old_path):
-            os.remove(old_path)
-
-        # -------------------- DOWNLOAD UPDATE_NEW.EXE --------------------
-        update_new_path = os.path.join(self.install_path, UPDATE_NEW_EXE)
-        if not os.path.exists(update_new_path):
-            download_file(f"{GITHUB_RELEASES}/{UPDATE_EXE}", update_new_path)
-
-        # -------------------- SHORTCUT --------------------
-        if self.shortcut_checkbox.isChecked():
-            create_shortcut(modmanager_path)
-
-        # -------------------- LAUNCH MODMANAGER --------------------
-        subprocess.Popen([modmanager_path])
-        self.finished_label.setText("✅ Finished updating Mod-Manager!")
+    def on_update_finished(self, success, message):
+        self.update_btn.setEnabled(True)
+        self.finished_label.setText(message)
+        if not success:
+            QMessageBox.critical(self, "Error", message)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -1,16 +1,16 @@
 VERSION = "1.0.0"  # Script version
 
-import sys, os, json, shutil, subprocess, zipfile
-from urllib.request import urlopen, urlretrieve
-from urllib.error import URLError
+import sys, os, json, shutil, subprocess, zipfile, tempfile, time, functools, requests
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import Request, urlopen
+from urllib.error import HTTPError, URLError
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton,
-    QComboBox, QTabWidget, QGridLayout, QScrollArea, QFrame, QFileDialog, QListWidget, QListWidgetItem
+    QComboBox, QTabWidget, QGridLayout, QScrollArea, QFrame, QFileDialog, QListWidget, QListWidgetItem,
+    QProgressBar
 )
-from PyQt6.QtGui import QPixmap, QFont
-from PyQt6.QtCore import Qt
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from PyQt6.QtGui import QImage, QPixmap, QFont
+from PyQt6.QtCore import Qt, QTimer, QThreadPool, QRunnable, QFileSystemWatcher, pyqtSignal
 
 # -------------------- BASE DIRECTORY --------------------
 if getattr(sys, 'frozen', False):
@@ -26,48 +26,288 @@ SETTINGS_FILE = os.path.join(RESOURCES, "settings.json")
 GAMES = {"gi": "Genshin Impact", "hsr": "Honkai Star Rail", "wuwa": "Wuthering Waves", "zzz": "Zenless Zone Zero"}
 CATEGORIES = ["characters", "weapons", "ui", "objects", "npcs"]
 GITHUB_REPO = "https://github.com/Sanddino00/Mod-Manager"
+GITHUB_API = "https://api.github.com/repos/Sanddino00/Mod-Manager"
 GITHUB_TAG = "v.1"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+EXTRACT_WORKERS = 8
+DISABLED_PREFIX = "DISABLED_"
+DISABLED_PREFIX_LEN = len(DISABLED_PREFIX)
 
 # -------------------- SETTINGS --------------------
-if not os.path.exists(SETTINGS_FILE):
-    settings = {
-        "mod_paths": {
-            "gi": os.path.join(BASE_DIR, "gimi", "mods"),
-            "hsr": os.path.join(BASE_DIR, "srmi", "mods"),
-            "wuwa": os.path.join(BASE_DIR, "wwmi", "mods"),
-            "zzz": os.path.join(BASE_DIR, "zzmi", "mods")
-        },
-        "theme": "dark",
-        "notifications_on_startup": True
-    }
-    with open(SETTINGS_FILE, "w") as f:
-        json.dump(settings, f, indent=2)
-else:
-    with open(SETTINGS_FILE, "r") as f:
-        settings = json.load(f)
+def _atomic_write_json(path, text):
+    """Replace path with the JSON text; a crash mid-write leaves the old file intact."""
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+class SettingsCache:
+    """settings.json read once and kept in memory; changes are written back
+    once they have settled instead of on every click."""
+
+    def __init__(self, path, defaults):
+        self.path = path
+        self._timer = None
+        # Writes (fsync included) happen off the GUI thread; a single-thread
+        # pool keeps them in order so an older write never lands last
+        self._writer = QThreadPool()
+        self._writer.setMaxThreadCount(1)
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                self.data = json.load(f)
+            self._saved = self._encode()  # JSON text last written to / read from disk
+        else:
+            self.data = defaults
+            self._saved = None
+            self.flush(block=True)
+
+    def _encode(self):
+        return json.dumps(self.data, separators=(",", ":"))
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def set(self, key, value):
+        self.data[key] = value
+        self.mark_dirty()
+
+    def mark_dirty(self):
+        # Coalesce rapid changes into one write; the timer is created on first
+        # use since there's no QApplication yet when the settings are loaded
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.setInterval(500)
+            self._timer.timeout.connect(self.flush)
+        self._timer.start()
+
+    def flush(self, block=False):
+        """Write pending changes now, in the background unless block is set;
+        no-op if nothing changed."""
+        if self._timer is not None:
+            self._timer.stop()
+        data = self._encode()
+        if data == self._saved:
+            return
+        self._saved = data
+        if block:
+            self._writer.waitForDone()
+            _atomic_write_json(self.path, data)
+        else:
+            self._writer.start(QRunnable.create(lambda: self._write(data)))
 
-# -------------------- WATCHDOG --------------------
-class ModFolderHandler(FileSystemEventHandler):
-    def __init__(self, callback):
-        self.callback = callback
-    def on_any_event(self, event):
-        self.callback()
+    def _write(self, data):
+        try:
+            _atomic_write_json(self.path, data)
+        except OSError as e:
+            self._saved = None  # retried on the next flush
+            print(f"Failed to save settings: {e}")
+
+settings_cache = SettingsCache(SETTINGS_FILE, {
+    "mod_paths": {
+        "gi": os.path.join(BASE_DIR, "gimi", "mods"),
+        "hsr": os.path.join(BASE_DIR, "srmi", "mods"),
+        "wuwa": os.path.join(BASE_DIR, "wwmi", "mods"),
+        "zzz": os.path.join(BASE_DIR, "zzmi", "mods")
+    },
+    "theme": "dark",
+    "notifications_on_startup": True
+})
+settings = settings_cache.data
+
+# -------------------- ICONS --------------------
+@functools.lru_cache(maxsize=512)
+def _scaled_image(icon_path):
+    # A QImage, unlike a QPixmap, may be built off the GUI thread, so this is
+    # the part warm_icon_cache can do in the background
+    return QImage(icon_path).scaled(100, 100, Qt.AspectRatioMode.KeepAspectRatio,
+                                    Qt.TransformationMode.SmoothTransformation)
+
+@functools.lru_cache(maxsize=512)
+def _scaled_pixmap(icon_path):
+    """Item icon decoded and scaled once; QPixmaps are implicitly shared so
+    several labels can reuse the same one."""
+    return QPixmap.fromImage(_scaled_image(icon_path))
+
+def warm_icon_cache(game):
+    """Decode a game's item icons ahead of time; meant for the thread pool."""
+    for category in CATEGORIES:
+        try:
+            with os.scandir(os.path.join(RESOURCES, "icons", f"{game}_{category}")) as it:
+                paths = [e.path for e in it if e.name.endswith(".png")]
+        except FileNotFoundError:
+            continue
+        for path in paths:
+            _scaled_image(path)
+
+# -------------------- DOWNLOAD --------------------
+def download_file(url, dest, progress_callback=None):
+    """Stream url into dest.
+
+    dest is either a file object or a path; for a path the data goes to
+    dest + ".part" first and an interrupted download is resumed from it.
+    The response's ETag/Last-Modified is kept next to the .part and sent as
+    If-Range, so a file that changed on the server is fetched again whole.
+    """
+    if not isinstance(dest, str):
+        _stream_to(url, dest, 0, {}, progress_callback)
+        return
+
+    part = dest + ".part"
+    validator_path = part + ".validator"
+    existing = os.path.getsize(part) if os.path.exists(part) else 0
+    validator = None
+    if existing:
+        try:
+            with open(validator_path, encoding="utf-8") as vf:
+                validator = vf.read().strip() or None
+        except OSError:
+            pass
+    # without a validator we can't tell whether the .part is still the same file
+    offset = existing if validator else 0
+    headers = {"Range": f"bytes={offset}-", "If-Range": validator} if offset else {}
+    with open(part, "ab" if offset else "wb") as f:
+        if not _stream_to(url, f, offset, headers, progress_callback, validator_path):
+            # Server rejected the range; start over
+            f.seek(0)
+            f.truncate()
+            _stream_to(url, f, 0, {}, progress_callback, validator_path)
+    os.replace(part, dest)
+    try:
+        os.remove(validator_path)
+    except OSError:
+        pass
+
+def _stream_to(url, f, offset, headers, progress_callback, validator_path=None):
+    with requests.get(url, stream=True, timeout=30, headers=headers) as r:
+        if offset and r.status_code == 200:
+            # range ignored, or If-Range saw a changed file: this is the whole body
+            f.seek(0)
+            f.truncate()
+            offset = 0
+        elif offset and r.status_code != 206:
+            return False
+        r.raise_for_status()
+        if validator_path and not offset:
+            _save_validator(validator_path, r.headers)
+        total = int(r.headers.get("content-length", 0)) + offset
+        done = offset
+        last_percent = -1
+        for chunk in r.iter_content(DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+            done += len(chunk)
+            if progress_callback and total:
+                percent = done * 100 // total
+                if percent != last_percent:
+                    last_percent = percent
+                    progress_callback(percent)
+    return True
+
+def _save_validator(path, headers):
+    """Remember what identifies this version of the file for a later If-Range."""
+    etag = headers.get("ETag")
+    # If-Range only accepts a strong ETag
+    validator = etag if etag and not etag.startswith("W/") else headers.get("Last-Modified")
+    try:
+        if validator:
+            with open(path, "w", encoding="utf-8") as vf:
+                vf.write(validator)
+        elif os.path.exists(path):
+            os.remove(path)
+    except OSError:
+        pass
+
+# -------------------- EXTRACT --------------------
+def extract_zip(zip_path, dest):
+    """extractall() with the files written from several threads.
+
+    resources.zip is mostly small icons, so extracting is dominated by
+    per-file open/close; folders are created up front so the workers never
+    race on makedirs.
+    """
+    folders = set()
+    files = []
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        for info in zip_ref.infolist():
+            # same sanitizing as extractall: no absolute or parent paths
+            parts = [p for p in info.filename.replace("\\", "/").split("/") if p not in ("", ".", "..")]
+            if not parts:
+                continue
+            target = os.path.join(dest, *parts)
+            if info.is_dir():
+                folders.add(target)
+            else:
+                folders.add(os.path.dirname(target))
+                files.append((info.filename, target))
+    for folder in folders:
+        os.makedirs(folder, exist_ok=True)
+    batches = [files[i::EXTRACT_WORKERS] for i in range(EXTRACT_WORKERS)]
+    with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as pool:
+        jobs = [pool.submit(_extract_members, zip_path, batch) for batch in batches if batch]
+        for job in jobs:
+            job.result()  # re-raise the first failure
+
+def _extract_members(zip_path, members):
+    # One ZipFile per worker; a shared one serializes reads on its file handle
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        for name, target in members:
+            with zip_ref.open(name) as source, open(target, "wb") as f:
+                shutil.copyfileobj(source, f)
 
 # -------------------- MOD MANAGER GUI --------------------
 class ModManager(QWidget):
+    # Latest release tag ("" when the check failed) and the response's ETag
+    update_checked = pyqtSignal(str, str)
+    # Update downloads run on the thread pool and report back through these
+    download_progress = pyqtSignal(int)        # percent
+    resources_updated = pyqtSignal(bool, str)  # success, message
+    exe_updated = pyqtSignal(bool, str)        # success, new exe path or error message
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(f"Mod Manager {VERSION}")
         self.resize(1200,800)
         self.selected_game = "gi"
+        self._current_base = settings["mod_paths"][self.selected_game]
         self.selected_category = "characters"
         self.selected_item = None
         self.items = []
         self.selected_mod_path = None
-
-        self.observer = Observer()
-        self.observer.start()
-
+        # (game, category) -> (items, frames) already built into that category's grid
+        self._grid_cache = {}
+        # category -> (game, category) key whose frames that grid currently shows
+        self._grid_shown = {}
+        self._watched_folder = None
+        # item folders found by the last scan of their category root
+        self._created_folders = set()
+
+        # Shared by every mod list entry; QFont needs the QApplication, so built here
+        self._font_enabled = QFont()
+        self._font_enabled.setBold(True)
+        self._font_disabled = QFont()
+        self._font_disabled.setItalic(True)
+
+        # Collapse bursts of filesystem events into a single mod list reload
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(200)
+        self._reload_timer.timeout.connect(self.load_mods)
+        # toggle_selected_mod reloads itself; the change notifications of its
+        # own rename are dropped until then
+        self._suppress_reload_until = 0.0
+
+        self.update_checked.connect(self.on_update_checked)
+        self.resources_updated.connect(self.on_resources_updated)
+        self.exe_updated.connect(self.on_exe_updated)
+
+        # Native watch on the selected item's folder, moved only when the
+        # selection does; notifications arrive on the GUI thread
+        self.fs_watcher = QFileSystemWatcher(self)
+        self.fs_watcher.directoryChanged.connect(self.on_mod_folder_event)
+
+        self._run_in_background(lambda game=self.selected_game: warm_icon_cache(game))
         self.init_ui()
         self.load_items()
 
@@ -99,18 +339,11 @@ class ModManager(QWidget):
         self.tab_widget.setTabPosition(QTabWidget.TabPosition.West)
         self.tabs = {}
         for cat in CATEGORIES:
+            # filled in by category_tab the first time the category is shown
             tab = QWidget()
-            scroll = QScrollArea()
-            scroll.setWidgetResizable(True)
-            content = QWidget()
-            grid = QGridLayout()
-            content.setLayout(grid)
-            scroll.setWidget(content)
-            layout = QVBoxLayout()
-            layout.addWidget(scroll)
-            tab.setLayout(layout)
+            tab.setLayout(QVBoxLayout())
             self.tab_widget.addTab(tab, cat.capitalize())
-            self.tabs[cat] = {"tab": tab, "grid": grid, "scroll": scroll, "content": content}
+            self.tabs[cat] = {"tab": tab, "loaded": False}
 
         # Settings tab
         self.settings_tab = QWidget()
@@ -142,6 +375,12 @@ class ModManager(QWidget):
         self.update_resources_btn.clicked.connect(self.update_resources)
         right_layout.addWidget(self.update_resources_btn)
 
+        self.download_progress_bar = QProgressBar()
+        self.download_progress_bar.setRange(0, 100)
+        self.download_progress_bar.hide()
+        self.download_progress.connect(self.download_progress_bar.setValue)
+        right_layout.addWidget(self.download_progress_bar)
+
         self.mod_list_widget = QListWidget()
         self.mod_list_widget.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
         self.mod_list_widget.itemClicked.connect(self.select_mod)
@@ -151,6 +390,19 @@ class ModManager(QWidget):
         main_layout.addLayout(center_layout)
         self.apply_theme()
 
+    def category_tab(self, category):
+        tab_data = self.tabs[category]
+        if not tab_data["loaded"]:
+            scroll = QScrollArea()
+            scroll.setWidgetResizable(True)
+            content = QWidget()
+            grid = QGridLayout()
+            content.setLayout(grid)
+            scroll.setWidget(content)
+            tab_data["tab"].layout().addWidget(scroll)
+            tab_data.update(grid=grid, scroll=scroll, content=content, loaded=True)
+        return tab_data
+
     # -------------------- SETTINGS TAB --------------------
     def create_settings_tab(self):
         self.path_labels = {}
@@ -174,29 +426,38 @@ class ModManager(QWidget):
         self.settings_layout.addStretch()
 
     def toggle_notifications(self):
-        settings["notifications_on_startup"] = not settings.get("notifications_on_startup", True)
-        with open(SETTINGS_FILE,"w") as f:
-            json.dump(settings,f,indent=2)
+        settings_cache.set("notifications_on_startup", not settings_cache.get("notifications_on_startup", True))
 
     def change_mod_path(self, game):
         folder = QFileDialog.getExistingDirectory(self,f"Select mod folder for {GAMES[game]}")
         if folder:
             settings["mod_paths"][game] = folder
             self.path_labels[game].setText(f"{GAMES[game]}: {folder}")
-            with open(SETTINGS_FILE,"w") as f:
-                json.dump(settings,f,indent=2)
+            settings_cache.mark_dirty()
+            self.invalidate_grid_cache(game)
+            if game == self.selected_game:
+                self._current_base = folder
             self.load_items()
 
     # -------------------- GAME / CATEGORY --------------------
     def change_game(self):
-        self.selected_game = self.game_combo.currentData()
+        # currentIndexChanged also fires for programmatic changes
+        game = self.game_combo.currentData()
+        if game == self.selected_game:
+            return
+        self.selected_game = game
+        self._current_base = settings["mod_paths"][self.selected_game]
         self.load_items()
 
     def tab_changed(self,index):
         if index < len(CATEGORIES):
+            if CATEGORIES[index] == self.selected_category:
+                return
             self.selected_category = CATEGORIES[index]
             self.load_items()
         else:
+            # no category while Settings is shown, so coming back reloads
+            self.selected_category = None
             self.selected_item = None
             self.clear_mod_list()
 
@@ -205,13 +466,27 @@ class ModManager(QWidget):
         if self.selected_category not in self.tabs:
             return
         self.selected_item = None
-        tab_data = self.tabs[self.selected_category]
+        tab_data = self.category_tab(self.selected_category)
         grid = tab_data["grid"]
-        # clear grid
-        for i in reversed(range(grid.count())):
-            widget = grid.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
+        content = tab_data["content"]
+        key = (self.selected_game, self.selected_category)
+        shown = self._grid_shown.get(self.selected_category)
+        cached = self._grid_cache.get(key)
+        if shown != key:
+            # hide the other game's frames (cached frames stay parented) and
+            # repaint the grid once afterwards
+            content.setUpdatesEnabled(False)
+            for frame in self._grid_cache.get(shown, (None, []))[1]:
+                frame.hide()
+            self._grid_shown[self.selected_category] = key
+            if cached:
+                for frame in cached[1]:
+                    frame.show()
+            content.setUpdatesEnabled(True)
+        if cached:
+            self.items = cached[0]
+            self.update_mod_counters()
+            return
 
         json_file = os.path.join(RESOURCES,f"{self.selected_category}_{self.selected_game}.json")
         if os.path.exists(json_file):
@@ -220,37 +495,55 @@ class ModManager(QWidget):
         else:
             self.items = []
 
-        # Auto-create main category subfolders
-        base_path = settings["mod_paths"][self.selected_game]
+        # Auto-create main category subfolders; one scan of the category root
+        # finds the existing ones instead of a stat per item
+        category_root = os.path.join(self._current_base, self.selected_category)
+        icon_prefix = os.path.join(RESOURCES, "icons", f"{self.selected_game}_{self.selected_category}")
+        # The scan also drops folders deleted since this root was last built
+        prefix = category_root + os.sep
+        self._created_folders = {f for f in self._created_folders if not f.startswith(prefix)}
+        try:
+            with os.scandir(category_root) as it:
+                self._created_folders.update(e.path for e in it if e.is_dir())
+        except FileNotFoundError:
+            pass
         for item in self.items:
-            folder = os.path.join(base_path, self.selected_category, item["id"])
-            os.makedirs(folder, exist_ok=True)
+            folder = os.path.join(category_root, item["id"])
+            if folder not in self._created_folders:
+                os.makedirs(folder, exist_ok=True)
+                self._created_folders.add(folder)
 
         # populate grid
+        frames = []
         row=0; col=0
+        content.setUpdatesEnabled(False)
         for item in self.items:
-            btn = self.create_item_widget(item)
+            btn = self.create_item_widget(item, icon_prefix, category_root)
             grid.addWidget(btn,row,col)
+            frames.append(btn)
             col += 1
             if col >= 3:
                 col=0
                 row+=1
+        content.setUpdatesEnabled(True)
+        self._grid_cache[key] = (self.items, frames)
+
+    def invalidate_grid_cache(self, game):
+        for key in [k for k in self._grid_cache if k[0] == game]:
+            _, frames = self._grid_cache.pop(key)
+            for frame in frames:
+                frame.setParent(None)
 
     # -------------------- ITEM WIDGET --------------------
-    def create_item_widget(self,item):
+    def create_item_widget(self,item,icon_prefix,base_folder):
         frame = QFrame()
         layout = QVBoxLayout()
         frame.setLayout(layout)
 
         # Icon
-        icon_path = os.path.join(
-            RESOURCES,
-            "icons",
-            f"{self.selected_game}_{self.selected_category}",
-            f"{item['id']}.png"
-        )
+        icon_path = os.path.join(icon_prefix, item['id'] + ".png")
         if os.path.exists(icon_path):
-            pix = QPixmap(icon_path).scaled(100, 100, Qt.AspectRatioMode.KeepAspectRatio)
+            pix = _scaled_pixmap(icon_path)
             icon_label = QLabel()
             icon_label.setPixmap(pix)
             icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -274,7 +567,8 @@ class ModManager(QWidget):
         layout.addWidget(warning_label)
         item['_warning_label'] = warning_label
 
-        self.update_mod_counter(item)
+        # load_items has just made sure the item folder exists
+        self.set_mod_counter(item, os.path.join(base_folder, item["id"]))
 
         # Click to select
         frame.setFrameShape(QFrame.Shape.Box)
@@ -295,56 +589,93 @@ class ModManager(QWidget):
     def load_mods(self):
         self.clear_mod_list()
         if not self.selected_item:
+            self._watched_folder = None
             return
 
         char_folder = os.path.join(
-            settings["mod_paths"][self.selected_game],
+            self._current_base,
             self.selected_category,
             self.selected_item["id"]
         )
+        # always checked: the folder may have been deleted since load_items
         os.makedirs(char_folder, exist_ok=True)
-
-        # Watch folder
-        self.observer.unschedule_all()
-        self.observer.schedule(ModFolderHandler(self.load_mods), char_folder, recursive=True)
+        self._watched_folder = char_folder
+        self.watch_folder(char_folder)
 
         mods = []
-        for f in os.listdir(char_folder):
-            full_path = os.path.join(char_folder, f)
-            if os.path.isdir(full_path):
-                disabled = f.startswith("DISABLED_")
-                display_name = f.replace("DISABLED_", "")
-                mods.append({"name": f, "display": display_name, "disabled": disabled, "path": full_path})
-
+        with os.scandir(char_folder) as it:
+            for entry in it:
+                if entry.is_dir():
+                    f = entry.name
+                    disabled = f.startswith(DISABLED_PREFIX)
+                    display_name = f[DISABLED_PREFIX_LEN:] if disabled else f
+                    mods.append({"name": f, "display": display_name, "disabled": disabled, "path": entry.path})
+
+        list_items = []
         for m in mods:
             item_text = m["display"]
-            font = QFont()
             if m["disabled"]:
                 item_text = f"[DISABLED] {item_text}"
-                font.setItalic(True)
-            else:
-                font.setBold(True)
             list_item = QListWidgetItem(item_text)
             list_item.setData(Qt.ItemDataRole.UserRole, m["path"])
-            list_item.setFont(font)
-            self.mod_list_widget.addItem(list_item)
+            list_item.setFont(self._font_disabled if m["disabled"] else self._font_enabled)
+            list_items.append(list_item)
+
+        # Add the rows as one batch: a single repaint and no per-row signals
+        lw = self.mod_list_widget
+        lw.setUpdatesEnabled(False)
+        lw.blockSignals(True)
+        try:
+            for list_item in list_items:
+                lw.addItem(list_item)
+        finally:
+            lw.blockSignals(False)
+            lw.setUpdatesEnabled(True)
 
         self.update_mod_counters()
 
+    # -------------------- WATCH --------------------
+    def watch_folder(self, folder):
+        # Reloads of the same item keep the existing watch; mods are the direct
+        # subfolders, which is all a directory watch reports. Qt forgets a
+        # folder that gets deleted, so compare against what it really watches.
+        watched = self.fs_watcher.directories()
+        if watched == [folder]:
+            return
+        if watched:
+            self.fs_watcher.removePaths(watched)
+        self.fs_watcher.addPath(folder)
+
+    def on_mod_folder_event(self, path):
+        if time.monotonic() < self._suppress_reload_until:
+            return
+        if self._watched_folder:
+            self._reload_timer.start()
+
     # -------------------- MOD COUNTERS --------------------
     def update_mod_counters(self):
+        # One scan of the category root instead of an exists() per item
+        category_root = os.path.join(self._current_base, self.selected_category)
+        dirs = {}
+        if os.path.isdir(category_root):
+            with os.scandir(category_root) as it:
+                dirs = {e.name: e.path for e in it if e.is_dir()}
         for item in self.items:
-            self.update_mod_counter(item)
+            self.set_mod_counter(item, dirs.get(item["id"]))
 
-    def update_mod_counter(self,item):
-        folder_path = os.path.join(settings["mod_paths"][self.selected_game],
-                                   self.selected_category, item["id"])
+    def set_mod_counter(self,item,folder_path):
         count = 0
         enabled_count = 0
-        if os.path.exists(folder_path):
-            subfolders = [f for f in os.listdir(folder_path) if os.path.isdir(os.path.join(folder_path,f))]
-            count = len(subfolders)
-            enabled_count = len([f for f in subfolders if not f.startswith("DISABLED_")])
+        if folder_path:
+            try:
+                with os.scandir(folder_path) as it:
+                    for e in it:
+                        if e.is_dir():
+                            count += 1
+                            if not e.name.startswith(DISABLED_PREFIX):
+                                enabled_count += 1
+            except FileNotFoundError:
+                pass  # deleted behind our back; counts as no mods
 
         # Update counter
         if '_counter_label' in item:
@@ -359,11 +690,8 @@ class ModManager(QWidget):
 
     # -------------------- SELECT MOD --------------------
     def select_mod(self,list_item):
+        # Highlighting is left to QListWidget::item:selected in apply_theme
         self.selected_mod_path = list_item.data(Qt.ItemDataRole.UserRole)
-        # Highlight selection
-        for i in range(self.mod_list_widget.count()):
-            self.mod_list_widget.item(i).setBackground(Qt.GlobalColor.transparent)
-        list_item.setBackground(Qt.GlobalColor.lightGray)
 
     # -------------------- TOGGLE MOD --------------------
     def toggle_selected_mod(self):
@@ -372,15 +700,17 @@ class ModManager(QWidget):
 
         parent_folder = os.path.dirname(self.selected_mod_path)
         folder_name = os.path.basename(self.selected_mod_path)
-        if folder_name.startswith("DISABLED_"):
-            new_name = folder_name.replace("DISABLED_", "")
+        if folder_name.startswith(DISABLED_PREFIX):
+            new_name = folder_name[DISABLED_PREFIX_LEN:]
         else:
-            new_name = f"DISABLED_{folder_name}"
+            new_name = DISABLED_PREFIX + folder_name
         new_path = os.path.join(parent_folder, new_name)
+        self._suppress_reload_until = time.monotonic() + 0.5
         try:
             os.rename(self.selected_mod_path, new_path)
             self.selected_mod_path = new_path
         except Exception as e:
+            self._suppress_reload_until = 0.0
             print(f"Failed to rename folder: {e}")
         self.load_mods()
 
@@ -389,7 +719,7 @@ class ModManager(QWidget):
         if not self.selected_item:
             return
         folder = os.path.join(
-            settings["mod_paths"][self.selected_game],
+            self._current_base,
             self.selected_category,
             self.selected_item["id"]
         )
@@ -403,10 +733,8 @@ class ModManager(QWidget):
 
     # -------------------- THEME --------------------
     def toggle_theme(self):
-        settings["theme"] = "dark" if settings["theme"]=="light" else "light"
+        settings_cache.set("theme", "dark" if settings["theme"]=="light" else "light")
         self.apply_theme()
-        with open(SETTINGS_FILE,"w") as f:
-            json.dump(settings,f,indent=2)
 
     def apply_theme(self):
         if settings["theme"]=="dark":
@@ -429,46 +757,131 @@ class ModManager(QWidget):
 
     # -------------------- UPDATE CHECK --------------------
     def check_updates_on_startup(self):
+        # Runs off the GUI thread so a slow network doesn't delay startup
+        self._run_in_background(self._check_updates_background)
+
+    def _check_updates_background(self):
+        tag = etag = ""
+        # Conditional request: GitHub answers 304 without a body, and without
+        # counting against the rate limit, while the latest release is unchanged
+        request = Request(f"{GITHUB_API}/releases/latest")
+        cached_etag = settings_cache.get("releases_etag")
+        if cached_etag:
+            request.add_header("If-None-Match", cached_etag)
         try:
-            with urlopen(f"{GITHUB_REPO}/releases/tag/{GITHUB_TAG}") as response:
-                if response.status == 200:
-                    print("Update available on GitHub!")
-        except URLError:
+            with urlopen(request, timeout=5) as response:
+                etag = response.headers.get("ETag", "")
+                tag = json.load(response).get("tag_name", "")
+        except HTTPError as e:
+            if e.code == 304:
+                tag, etag = settings_cache.get("latest_tag", ""), cached_etag
+        except (URLError, OSError, ValueError):
+            pass
+        self._emit_from_worker(self.update_checked, tag, etag)
+
+    def on_update_checked(self, tag, etag):
+        if tag and etag:
+            settings["releases_etag"] = etag
+            settings["latest_tag"] = tag
+            settings_cache.mark_dirty()  # no write if both are unchanged
+        if not tag:
             print("Could not check for updates.")
+        elif tag.lstrip("v.") != VERSION:
+            print(f"Update available on GitHub! ({tag})")
 
+    # -------------------- UPDATE DOWNLOADS --------------------
     def update_resources(self):
+        self._start_download(self._update_resources_job)
+
+    def _update_resources_job(self):
         zip_url = f"{GITHUB_REPO}/releases/download/{GITHUB_TAG}/resources.zip"
         zip_path = os.path.join(BASE_DIR,"resources.zip")
         try:
-            urlretrieve(zip_url, zip_path)
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(BASE_DIR)
+            download_file(zip_url, zip_path, self._report_progress)
+            extract_zip(zip_path, BASE_DIR)
             os.remove(zip_path)
-            print("Resources updated successfully!")
         except Exception as e:
-            print(f"Failed to update resources: {e}")
+            self._emit_from_worker(self.resources_updated, False, f"Failed to update resources: {e}")
+            return
+        self._emit_from_worker(self.resources_updated, True, "Resources updated successfully!")
+
+    def on_resources_updated(self, ok, message):
+        self._finish_download()
+        print(message)
+        if ok:
+            # icons and item lists may have changed under the same names
+            _scaled_pixmap.cache_clear()
+            _scaled_image.cache_clear()
+            for game in GAMES:
+                self.invalidate_grid_cache(game)
+            self.load_items()
 
     def update_exe(self):
+        self._start_download(self._update_exe_job)
+
+    def _update_exe_job(self):
         exe_url = f"{GITHUB_REPO}/releases/download/{GITHUB_TAG}/Mod-Manager.exe"
         exe_path = os.path.join(BASE_DIR,"Mod-Manager_new.exe")
         try:
-            urlretrieve(exe_url, exe_path)
+            # Nothing touches disk until the whole exe has arrived
+            with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as buf:
+                download_file(exe_url, buf, self._report_progress)
+                buf.seek(0)
+                with open(exe_path, "wb") as f:
+                    shutil.copyfileobj(buf, f)
             current_exe = sys.executable
             os.replace(exe_path, current_exe)
-            subprocess.Popen([current_exe])
-            sys.exit()
         except Exception as e:
-            print(f"Failed to update EXE: {e}")
+            self._emit_from_worker(self.exe_updated, False, f"Failed to update EXE: {e}")
+            return
+        self._emit_from_worker(self.exe_updated, True, current_exe)
+
+    def on_exe_updated(self, ok, result):
+        self._finish_download()
+        if not ok:
+            print(result)
+            return
+        # quit() skips closeEvent; write settings before the new exe reads them
+        settings_cache.flush(block=True)
+        subprocess.Popen([result])
+        QApplication.quit()
+
+    def _start_download(self, job):
+        # one download at a time; the buttons come back in _finish_download
+        self.update_exe_btn.setEnabled(False)
+        self.update_resources_btn.setEnabled(False)
+        self.download_progress_bar.setValue(0)
+        self.download_progress_bar.show()
+        self._run_in_background(job)
+
+    def _finish_download(self):
+        self.download_progress_bar.hide()
+        self.update_exe_btn.setEnabled(True)
+        self.update_resources_btn.setEnabled(True)
+
+    def _report_progress(self, percent):
+        self._emit_from_worker(self.download_progress, percent)
+
+    # -------------------- BACKGROUND JOBS --------------------
+    def _run_in_background(self, fn):
+        QThreadPool.globalInstance().start(QRunnable.create(fn))
+
+    def _emit_from_worker(self, signal, *args):
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            pass  # window was closed while the job was running
 
     # -------------------- CLOSE --------------------
     def closeEvent(self,event):
-        self.observer.stop()
-        self.observer.join()
+        settings_cache.flush(block=True)
         event.accept()
 
 # -------------------- RUN --------------------
 if __name__=="__main__":
     app = QApplication(sys.argv)
+    # also covers quit paths that never reach closeEvent
+    app.aboutToQuit.connect(lambda: settings_cache.flush(block=True))
     window = ModManager()
     window.show()
     sys.exit(app.exec())
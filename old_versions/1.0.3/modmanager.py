@@ -1,14 +1,15 @@
 # Mod Manager v1.0.3
 VERSION = "v1.0.3"
 
-import sys, os, json, shutil, subprocess, zipfile, requests
+import sys, os, json, subprocess, zipfile, requests, functools, time
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton,
     QComboBox, QTabWidget, QGridLayout, QScrollArea, QFrame, QFileDialog, QListWidget, QListWidgetItem
 )
 from PyQt6.QtGui import QPixmap, QFont
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QTimer, QThreadPool, QRunnable, pyqtSignal
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 
 # -------------------- BASE DIRECTORY --------------------
@@ -25,6 +26,28 @@ SETTINGS_FILE = os.path.join(RESOURCES, "settings.json")
 GAMES = {"gi": "Genshin Impact", "hsr": "Honkai Star Rail", "wuwa": "Wuthering Waves", "zzz": "Zenless Zone Zero"}
 CATEGORIES = ["characters", "weapons", "ui", "objects", "npcs"]
 GITHUB_RELEASES = "https://github.com/Sanddino00/Mod-Manager/releases/latest"
+UPDATE_CHECK_INTERVAL_MS = 6 * 3600 * 1000
+# Filesystems whose change notifications can't be trusted; watched by polling instead
+NETWORK_FS_TYPES = {"nfs", "nfs4", "cifs", "smb3", "smbfs", "fuse.sshfs", "9p"}
+DISABLED_PREFIX = "DISABLED_"
+DISABLED_PREFIX_LEN = len(DISABLED_PREFIX)
+
+# -------------------- THEMES --------------------
+DARK_QSS = """
+    QWidget { background-color: #222; color: #eee; }
+    QScrollArea { background-color: #222; }
+    QTabWidget::pane { background: #222; }
+    QLabel, QPushButton, QComboBox, QListWidget { color: #eee; }
+    QListWidget::item:selected { background-color: #555555; color: #ffffff; }
+"""
+LIGHT_QSS = """
+    QWidget { background-color: #d3d3d3; color: #222; }
+    QScrollArea { background-color: #d3d3d3; }
+    QTabWidget::pane { background: #ccc; }
+    QLabel, QPushButton, QComboBox { color: #222; }
+    QListWidget { background-color: #444444; color: #ffffff; }
+    QListWidget::item:selected { background-color: #666666; color: #ffffff; }
+"""
 
 # -------------------- SETTINGS --------------------
 if not os.path.exists(SETTINGS_FILE):
@@ -44,15 +67,77 @@ else:
     with open(SETTINGS_FILE, "r") as f:
         settings = json.load(f)
 
+# -------------------- ICONS --------------------
+@functools.lru_cache(maxsize=512)
+def get_scaled_icon(path):
+    """Decode and scale an item icon once; QPixmaps are shared, not copied, between labels."""
+    return QPixmap(path).scaled(100, 100, Qt.AspectRatioMode.KeepAspectRatio,
+                                Qt.TransformationMode.SmoothTransformation)
+
+# -------------------- MOD COUNTING --------------------
+def parse_mod_name(name):
+    """Return (disabled, display name) for a mod folder name."""
+    if name.startswith(DISABLED_PREFIX):
+        return True, name[DISABLED_PREFIX_LEN:]
+    return False, name
+
+def count_mods(folder_path):
+    """Return (total, enabled) mod subfolders of an item folder."""
+    count = 0
+    enabled_count = 0
+    try:
+        it = os.scandir(folder_path)
+    except FileNotFoundError:
+        return count, enabled_count  # not created until the item is first selected
+    with it:
+        for e in it:
+            if e.is_dir():
+                count += 1
+                if not e.name.startswith(DISABLED_PREFIX):
+                    enabled_count += 1
+    return count, enabled_count
+
 # -------------------- WATCHDOG --------------------
-class ModFolderHandler(FileSystemEventHandler):
-    def __init__(self, callback):
-        self.callback = callback
+def is_network_path(path):
+    """True if path lives on a network share (mapped drive/UNC on Windows, NFS/SMB mount on Linux)."""
+    path = os.path.abspath(path)
+    if sys.platform == "win32":
+        import ctypes
+        drive = os.path.splitdrive(path)[0]
+        if drive.startswith("\\\\"):
+            return True  # UNC path
+        DRIVE_REMOTE = 4
+        return ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == DRIVE_REMOTE
+    try:
+        with open("/proc/mounts") as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+    # the longest mount point containing path decides the filesystem type
+    path = os.path.realpath(path)
+    best, fstype = "", ""
+    for mount_point, mount_type in mounts:
+        mount_point = mount_point.replace("\\040", " ")
+        if (path == mount_point or path.startswith(mount_point.rstrip("/") + "/")) and len(mount_point) > len(best):
+            best, fstype = mount_point, mount_type
+    return fstype in NETWORK_FS_TYPES
+
+class ModFolderHandler(QObject, FileSystemEventHandler):
+    # on_any_event runs on the watchdog thread; receivers get it queued on theirs
+    changed = pyqtSignal()
+
     def on_any_event(self, event):
-        self.callback()
+        self.changed.emit()
 
 # -------------------- MOD MANAGER GUI --------------------
 class ModManager(QWidget):
+    # (game, category, {item_id: (count, enabled_count)}) from the counter worker
+    counters_ready = pyqtSignal(str, str, dict)
+    # Results of the network jobs run on the thread pool
+    update_checked = pyqtSignal(str)    # latest release tag, "" if unknown
+    exe_downloaded = pyqtSignal(bool, str)  # ok, path of the freshly installed exe or error
+    resources_updated = pyqtSignal(bool, str)  # ok, error if not
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Mod Manager")
@@ -62,10 +147,45 @@ class ModManager(QWidget):
         self.selected_item = None
         self.items = []
         self.selected_mod_path = None
-
-        self.observer = Observer()
-        self.observer.start()
-
+        # (game, category) -> (json mtime, items, frames) already built into that grid
+        self._item_widgets_cache = {}
+        self._recounted_ids = set()
+        # json path -> (mtime_ns, parsed item list)
+        self._json_cache = {}
+        # category -> (game, json mtime_ns) the grid currently shows
+        self._grid_state = {}
+
+        # The first event of a burst reloads at once; the rest are coalesced
+        # into one more reload once things have been quiet for 300 ms
+        self._reload_pending = False
+        self._suppress_reload_until = 0.0  # ignore the events of our own renames
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(300)
+        self._reload_timer.timeout.connect(self._reload_cooldown_done)
+        self.folder_handler = ModFolderHandler(self)
+        self.folder_handler.changed.connect(self._on_mods_changed, Qt.ConnectionType.QueuedConnection)
+        self.counters_ready.connect(self._apply_counters)
+        self.update_checked.connect(self._on_update_checked)
+        self.exe_downloaded.connect(self._on_exe_downloaded)
+        self.resources_updated.connect(self._on_resources_updated)
+
+        # One keep-alive session for all GitHub requests
+        self._net = requests.Session()
+
+        self.observer = None
+        self._observer_polling = None
+        self._watch_handle = None
+        self._watched_path = None
+        self._ensure_observer()
+
+        # Shared by every mod list entry; QFont needs the QApplication, so built here
+        self._font_enabled = QFont()
+        self._font_enabled.setBold(True)
+        self._font_disabled = QFont()
+        self._font_disabled.setItalic(True)
+
+        self._applied_theme = None
         self.init_ui()
         self.load_items()
 
@@ -148,9 +268,13 @@ class ModManager(QWidget):
         main_layout.addLayout(center_layout)
         self.apply_theme()
 
-        # Initial update check
+        # Initial update check, then a slow re-check for long-running sessions
         if settings.get("auto_update_check", True):
             self.check_for_update()
+            self._update_timer = QTimer(self)
+            self._update_timer.setInterval(UPDATE_CHECK_INTERVAL_MS)
+            self._update_timer.timeout.connect(self.check_for_update)
+            self._update_timer.start()
 
     # -------------------- SETTINGS TAB --------------------
     def create_settings_tab(self):
@@ -171,6 +295,7 @@ class ModManager(QWidget):
     # -------------------- GAME / CATEGORY --------------------
     def change_game(self):
         self.selected_game = self.game_combo.currentData()
+        self._ensure_observer()
         self.load_items()
 
     def tab_changed(self,index):
@@ -188,32 +313,59 @@ class ModManager(QWidget):
         self.selected_item = None
         tab_data = self.tabs[self.selected_category]
         grid = tab_data["grid"]
-        # clear grid
-        for i in reversed(range(grid.count())):
+
+        key = (self.selected_game, self.selected_category)
+        json_file = os.path.join(RESOURCES,f"{self.selected_category}_{self.selected_game}.json")
+        mtime = os.stat(json_file).st_mtime_ns if os.path.exists(json_file) else None
+        state = (self.selected_game, mtime)
+        if self._grid_state.get(self.selected_category) == state and grid.count() > 0:
+            # grid already shows this game's items; only the counters may be stale
+            self.items = self._item_widgets_cache[key][1]
+            self.refresh_all_counters_async()
+            return
+        self._grid_state[self.selected_category] = state
+
+        # hide whatever the grid currently shows; cached frames stay parented
+        for i in range(grid.count()):
             widget = grid.itemAt(i).widget()
             if widget:
-                widget.setParent(None)
+                widget.hide()
+
+        cached = self._item_widgets_cache.pop(key, None)
+        if cached and cached[0] == mtime:
+            self._item_widgets_cache[key] = cached
+            _, self.items, frames = cached
+            for frame in frames:
+                frame.show()
+            self.refresh_all_counters_async()
+            return
+        if cached:
+            # item list changed on disk; drop the stale frames
+            for frame in cached[2]:
+                frame.setParent(None)
 
-        json_file = os.path.join(RESOURCES,f"{self.selected_category}_{self.selected_game}.json")
-        if os.path.exists(json_file):
+        if mtime is None:
+            self.items = []
+        elif self._json_cache.get(json_file, (None, None))[0] == mtime:
+            self.items = self._json_cache[json_file][1]
+        else:
             with open(json_file,"r") as f:
                 self.items = json.load(f)
-        else:
-            self.items = []
-
-        base_path = settings["mod_paths"][self.selected_game]
-        for item in self.items:
-            folder = os.path.join(base_path, self.selected_category, item["id"])
-            os.makedirs(folder, exist_ok=True)
+            self._json_cache[json_file] = (mtime, self.items)
 
+        # Item folders are created on demand when the item is selected (load_mods)
+        frames = []
         row=0; col=0
         for item in self.items:
             btn = self.create_item_widget(item)
             grid.addWidget(btn,row,col)
+            frames.append(btn)
             col += 1
             if col >= 3:
                 col=0
                 row+=1
+        self._item_widgets_cache[key] = (mtime, self.items, frames)
+        self.refresh_all_counters_async()
 
     # -------------------- ITEM WIDGET --------------------
     def create_item_widget(self,item):
@@ -228,7 +380,7 @@ class ModManager(QWidget):
             f"{item['id']}.png"
         )
         if os.path.exists(icon_path):
-            pix = QPixmap(icon_path).scaled(100, 100, Qt.AspectRatioMode.KeepAspectRatio)
+            pix = get_scaled_icon(icon_path)
             icon_label = QLabel()
             icon_label.setPixmap(pix)
             icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -249,8 +401,6 @@ class ModManager(QWidget):
         layout.addWidget(warning_label)
         item['_warning_label'] = warning_label
 
-        self.update_mod_counter(item)
-
         frame.setFrameShape(QFrame.Shape.Box)
         frame.mousePressEvent = lambda e, i=item: self.select_item(i)
 
@@ -267,8 +417,8 @@ class ModManager(QWidget):
         self.selected_mod_path = None
 
     def load_mods(self):
-        self.clear_mod_list()
         if not self.selected_item:
+            self.clear_mod_list()
             return
 
         char_folder = os.path.join(
@@ -278,47 +428,123 @@ class ModManager(QWidget):
         )
         os.makedirs(char_folder, exist_ok=True)
 
-        self.observer.unschedule_all()
-        self.observer.schedule(ModFolderHandler(self.load_mods), char_folder, recursive=True)
-
-        mods = []
-        for f in os.listdir(char_folder):
-            full_path = os.path.join(char_folder, f)
-            if os.path.isdir(full_path):
-                disabled = f.startswith("DISABLED_")
-                display_name = f.replace("DISABLED_", "")
-                mods.append({"name": f, "display": display_name, "disabled": disabled, "path": full_path})
-
-        for m in mods:
-            item_text = m["display"]
-            font = QFont()
-            if m["disabled"]:
-                item_text = f"[DISABLED] {item_text}"
-                font.setItalic(True)
-            else:
-                font.setBold(True)
-            list_item = QListWidgetItem(item_text)
-            list_item.setData(Qt.ItemDataRole.UserRole, m["path"])
-            list_item.setFont(font)
-            self.mod_list_widget.addItem(list_item)
+        # Keep the existing watch while the same item stays selected. Mods are the
+        # direct subfolders, so changes deeper down don't affect the list.
+        if char_folder != self._watched_path:
+            if self._watch_handle is not None:
+                self.observer.unschedule(self._watch_handle)
+            self._watch_handle = self.observer.schedule(
+                self.folder_handler, char_folder, recursive=False)
+            self._watched_path = char_folder
+
+        found = []
+        with os.scandir(char_folder) as it:
+            for entry in it:
+                if entry.is_dir():
+                    f = entry.name
+                    disabled, display_name = parse_mod_name(f)
+                    found.append({"name": f, "display": display_name, "disabled": disabled, "path": entry.path})
+        mods = {m["display"]: m for m in found}
+
+        # Diff against the rows already shown (keyed by display name, so an
+        # enable/disable rename updates its row in place) and repaint once
+        lw = self.mod_list_widget
+        lw.setUpdatesEnabled(False)
+        lw.blockSignals(True)
+        try:
+            if len(mods) != len(found):
+                # both "X" and "DISABLED_X" exist; the display name can't tell rows apart
+                lw.clear()
+                mods = {m["name"]: m for m in found}
+            selected = self.selected_mod_path
+            self.selected_mod_path = None
+            for row in reversed(range(lw.count())):
+                list_item = lw.item(row)
+                old_path = list_item.data(Qt.ItemDataRole.UserRole)
+                m = mods.pop(parse_mod_name(os.path.basename(old_path))[1], None)
+                if m is None:
+                    lw.takeItem(row)
+                    continue
+                if m["path"] != old_path:
+                    self._show_mod(list_item, m)
+                if old_path == selected:
+                    self.selected_mod_path = m["path"]
+            for m in mods.values():
+                list_item = QListWidgetItem()
+                self._show_mod(list_item, m)
+                lw.addItem(list_item)
+        finally:
+            lw.blockSignals(False)
+            lw.setUpdatesEnabled(True)
+
+        self.refresh_counter(self.selected_item)
+
+    def _show_mod(self, list_item, m):
+        item_text = m["display"]
+        if m["disabled"]:
+            item_text = f"[DISABLED] {item_text}"
+        list_item.setText(item_text)
+        list_item.setData(Qt.ItemDataRole.UserRole, m["path"])
+        list_item.setFont(self._font_disabled if m["disabled"] else self._font_enabled)
+
+    def _ensure_observer(self):
+        # Native notifications are unreliable on network shares, so poll those
+        # (every 5 s rather than watchdog's 1 s default)
+        polling = is_network_path(settings["mod_paths"][self.selected_game])
+        if self.observer is not None and polling == self._observer_polling:
+            return
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+        self.observer = PollingObserver(timeout=5) if polling else Observer()
+        self.observer.start()
+        self._observer_polling = polling
+        self._watch_handle = None
+        self._watched_path = None
 
-        self.update_mod_counters()
+    def _on_mods_changed(self):
+        if time.monotonic() < self._suppress_reload_until:
+            return
+        if self._reload_timer.isActive():
+            self._reload_pending = True
+        else:
+            self.load_mods()
+        self._reload_timer.start()
 
-    # -------------------- MOD COUNTERS --------------------
-    def update_mod_counters(self):
-        for item in self.items:
-            self.update_mod_counter(item)
+    def _reload_cooldown_done(self):
+        if self._reload_pending:
+            self._reload_pending = False
+            self.load_mods()
 
-    def update_mod_counter(self,item):
+    # -------------------- MOD COUNTERS --------------------
+    def refresh_counter(self,item):
         folder_path = os.path.join(settings["mod_paths"][self.selected_game],
                                    self.selected_category, item["id"])
-        count = 0
-        enabled_count = 0
-        if os.path.exists(folder_path):
-            subfolders = [f for f in os.listdir(folder_path) if os.path.isdir(os.path.join(folder_path,f))]
-            count = len(subfolders)
-            enabled_count = len([f for f in subfolders if not f.startswith("DISABLED_")])
+        self._set_counter(item, *count_mods(folder_path))
+        # a category scan already in flight must not overwrite this newer count
+        self._recounted_ids.add(item["id"])
+
+    def refresh_all_counters_async(self):
+        # Scan every item folder of the category on the thread pool
+        self._recounted_ids = set()
+        game, category = self.selected_game, self.selected_category
+        category_root = os.path.join(settings["mod_paths"][game], category)
+        ids = [item["id"] for item in self.items]
+
+        def scan():
+            counts = {i: count_mods(os.path.join(category_root, i)) for i in ids}
+            self._emit_from_worker(self.counters_ready, game, category, counts)
+
+        self._run_in_background(scan)
+
+    def _apply_counters(self, game, category, counts):
+        if (game, category) != (self.selected_game, self.selected_category):
+            return  # user moved on; that view gets its own refresh
+        for item in self.items:
+            if item["id"] in counts and item["id"] not in self._recounted_ids:
+                self._set_counter(item, *counts[item["id"]])
 
+    def _set_counter(self,item,count,enabled_count):
         if '_counter_label' in item:
             item['_counter_label'].setText(f"Mods: {count}")
         if '_warning_label' in item:
@@ -329,10 +555,8 @@ class ModManager(QWidget):
 
     # -------------------- SELECT MOD --------------------
     def select_mod(self,list_item):
+        # Highlighting is left to QListWidget::item:selected in apply_theme
         self.selected_mod_path = list_item.data(Qt.ItemDataRole.UserRole)
-        for i in range(self.mod_list_widget.count()):
-            self.mod_list_widget.item(i).setBackground(Qt.GlobalColor.transparent)
-        list_item.setBackground(Qt.GlobalColor.lightGray)
 
     # -------------------- TOGGLE MOD --------------------
     def toggle_selected_mod(self):
@@ -341,17 +565,35 @@ class ModManager(QWidget):
 
         parent_folder = os.path.dirname(self.selected_mod_path)
         folder_name = os.path.basename(self.selected_mod_path)
-        if folder_name.startswith("DISABLED_"):
-            new_name = folder_name.replace("DISABLED_", "")
+        if folder_name.startswith(DISABLED_PREFIX):
+            new_name = folder_name[DISABLED_PREFIX_LEN:]
         else:
-            new_name = f"DISABLED_{folder_name}"
+            new_name = DISABLED_PREFIX + folder_name
         new_path = os.path.join(parent_folder, new_name)
+        old_path = self.selected_mod_path
         try:
-            os.rename(self.selected_mod_path, new_path)
-            self.selected_mod_path = new_path
+            os.rename(old_path, new_path)
         except Exception as e:
             print(f"Failed to rename folder: {e}")
-        self.load_mods()
+            self.load_mods()
+            return
+
+        # Update just the affected row; the watchdog events of this rename
+        # would otherwise trigger a full reload
+        self._suppress_reload_until = time.monotonic() + 0.5
+        self.selected_mod_path = new_path
+        list_item = self.mod_list_widget.currentItem()
+        if list_item is None or list_item.data(Qt.ItemDataRole.UserRole) != old_path:
+            list_item = next((self.mod_list_widget.item(i) for i in range(self.mod_list_widget.count())
+                              if self.mod_list_widget.item(i).data(Qt.ItemDataRole.UserRole) == old_path), None)
+        if list_item is None:
+            self.load_mods()
+            return
+        disabled, display_name = parse_mod_name(new_name)
+        self._show_mod(list_item, {"name": new_name, "display": display_name, "disabled": disabled, "path": new_path})
+        if self.selected_item:
+            # None once the user switched category or game; the list stays shown
+            self.refresh_counter(self.selected_item)
 
     # -------------------- OPEN FOLDER --------------------
     def open_selected_folder(self):
@@ -378,33 +620,54 @@ class ModManager(QWidget):
             json.dump(settings,f,indent=2)
 
     def apply_theme(self):
-        if settings["theme"]=="dark":
-            self.setStyleSheet("""
-                QWidget { background-color: #222; color: #eee; }
-                QScrollArea { background-color: #222; }
-                QTabWidget::pane { background: #222; }
-                QLabel, QPushButton, QComboBox, QListWidget { color: #eee; }
-                QListWidget::item:selected { background-color: #555555; color: #ffffff; }
-            """)
-        else:
-            self.setStyleSheet("""
-                QWidget { background-color: #d3d3d3; color: #222; }
-                QScrollArea { background-color: #d3d3d3; }
-                QTabWidget::pane { background: #ccc; }
-                QLabel, QPushButton, QComboBox { color: #222; }
-                QListWidget { background-color: #444444; color: #ffffff; }
-                QListWidget::item:selected { background-color: #666666; color: #ffffff; }
-            """)
+        # Set once on the application instead of cascading from this widget
+        if settings["theme"] == self._applied_theme:
+            return
+        QApplication.instance().setStyleSheet(DARK_QSS if settings["theme"]=="dark" else LIGHT_QSS)
+        self._applied_theme = settings["theme"]
+
+    # -------------------- BACKGROUND JOBS --------------------
+    def _run_in_background(self, fn):
+        QThreadPool.globalInstance().start(QRunnable.create(fn))
+
+    def _emit_from_worker(self, signal, *args):
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            pass  # window closed while the job was running
 
     # -------------------- UPDATE CHECK & BUTTONS --------------------
     def get_latest_release_info(self):
+        # releases/latest redirects to releases/tag/<tag>; HEAD skips the page body
         try:
-            r = requests.get(GITHUB_RELEASES, allow_redirects=True)
+            r = self._net.head(GITHUB_RELEASES, allow_redirects=True, timeout=10)
             latest_tag = r.url.split('/')[-1]
             return latest_tag
         except:
             return None
 
+    def _download(self, url, path):
+        # Stream into <path>.part and only move it into place once it is
+        # complete and on disk, so a cut-off download never replaces a good file
+        part = path + ".part"
+        try:
+            with self._net.get(url, stream=True, timeout=30) as r:
+                r.raise_for_status()
+                expected = r.headers.get("Content-Length")
+                written = 0
+                with open(part, "wb", buffering=1 << 20) as f:
+                    for chunk in r.iter_content(chunk_size=1 << 20):
+                        f.write(chunk)
+                        written += len(chunk)
+                    f.flush()
+                    os.fsync(f.fileno())
+            if expected is not None and written != int(expected):
+                raise IOError(f"Incomplete download of {url}: {written} of {expected} bytes")
+            os.replace(part, path)
+        finally:
+            if os.path.exists(part):
+                os.remove(part)
+
     def compare_versions(self, current, latest):
         try:
             cur = [int(x) for x in current.strip('v').split('.')]
@@ -414,53 +677,99 @@ class ModManager(QWidget):
             return False
 
     def check_for_update(self):
-        latest = self.get_latest_release_info()
+        self._run_in_background(
+            lambda: self._emit_from_worker(self.update_checked, self.get_latest_release_info() or ""))
+
+    def _on_update_checked(self, latest):
         current = VERSION
         if latest and self.compare_versions(current, latest):
             self.update_dot.setStyleSheet("border-radius: 7px; background-color: green;")
         else:
             self.update_dot.setStyleSheet("border-radius: 7px; background-color: red;")
 
+    def _start_update(self, job):
+        # one update at a time: both jobs share the session and the exe/.part paths
+        self.exe_btn.setEnabled(False)
+        self.res_btn.setEnabled(False)
+        self._run_in_background(job)
+
+    def _finish_update(self):
+        self.exe_btn.setEnabled(True)
+        self.res_btn.setEnabled(True)
+
     def update_exe(self):
+        self._start_update(self._update_exe_job)
+
+    def _update_exe_job(self):
         latest = self.get_latest_release_info()
         if not latest:
+            self._emit_from_worker(self.exe_downloaded, False, "Unable to check latest release")
             return
         exe_url = f"https://github.com/Sanddino00/Mod-Manager/releases/download/{latest}/modmanager.exe"
-        exe_path = os.path.join(BASE_DIR,"modmanager_new.exe")
+        exe_path = os.path.join(BASE_DIR,"modmanager.exe")
+        old_path = exe_path + ".old"
         try:
-            r = requests.get(exe_url, stream=True)
-            with open(exe_path,"wb") as f:
-                shutil.copyfileobj(r.raw,f)
-            os.replace(exe_path, os.path.join(BASE_DIR,"modmanager.exe"))
-            subprocess.Popen([os.path.join(BASE_DIR,"modmanager.exe")])
-            QApplication.quit()
+            # Windows won't overwrite the running exe but will rename it; the
+            # .old copy is removed on the next start
+            if os.path.exists(exe_path):
+                os.replace(exe_path, old_path)
+            self._download(exe_url, exe_path)
         except Exception as e:
-            print(f"Failed to update exe: {e}")
+            if os.path.exists(old_path) and not os.path.exists(exe_path):
+                os.replace(old_path, exe_path)
+            self._emit_from_worker(self.exe_downloaded, False, str(e))
+            return
+        self._emit_from_worker(self.exe_downloaded, True, exe_path)
+
+    def _on_exe_downloaded(self, ok, result):
+        if not ok:
+            print(f"Failed to update exe: {result}")
+            self._finish_update()
+            return
+        subprocess.Popen([result])
+        QApplication.quit()
 
     def update_resources(self):
+        self._start_update(self._update_resources_job)
+
+    def _update_resources_job(self):
         latest = self.get_latest_release_info()
         if not latest:
+            self._emit_from_worker(self.resources_updated, False, "Unable to check latest release")
             return
         zip_url = f"https://github.com/Sanddino00/Mod-Manager/releases/download/{latest}/resources.zip"
         zip_path = os.path.join(BASE_DIR,"resources_new.zip")
         try:
-            r = requests.get(zip_url, stream=True)
-            with open(zip_path,"wb") as f:
-                shutil.copyfileobj(r.raw,f)
+            self._download(zip_url, zip_path)
             with zipfile.ZipFile(zip_path,"r") as zip_ref:
                 zip_ref.extractall(BASE_DIR)
             os.remove(zip_path)
-            self.load_items()
         except Exception as e:
-            print(f"Failed to update resources: {e}")
+            self._emit_from_worker(self.resources_updated, False, str(e))
+            return
+        self._emit_from_worker(self.resources_updated, True, "")
+
+    def _on_resources_updated(self, ok, error):
+        self._finish_update()
+        if not ok:
+            print(f"Failed to update resources: {error}")
+            return
+        # icons and item lists may have changed under the same names
+        get_scaled_icon.cache_clear()
+        for _, _, frames in self._item_widgets_cache.values():
+            for frame in frames:
+                frame.setParent(None)
+        self._item_widgets_cache.clear()
+        self._grid_state.clear()
+        self.load_items()
 
     def add_update_buttons_to_settings(self):
-        exe_btn = QPushButton("Update EXE")
-        exe_btn.clicked.connect(self.update_exe)
-        res_btn = QPushButton("Update Resources")
-        res_btn.clicked.connect(self.update_resources)
-        self.settings_layout.addWidget(exe_btn)
-        self.settings_layout.addWidget(res_btn)
+        self.exe_btn = QPushButton("Update EXE")
+        self.exe_btn.clicked.connect(self.update_exe)
+        self.res_btn = QPushButton("Update Resources")
+        self.res_btn.clicked.connect(self.update_resources)
+        self.settings_layout.addWidget(self.exe_btn)
+        self.settings_layout.addWidget(self.res_btn)
 
     # -------------------- CLOSE --------------------
     def closeEvent(self,event):
@@ -470,6 +779,11 @@ class ModManager(QWidget):
 
 # -------------------- RUN --------------------
 if __name__=="__main__":
+    # left behind by update_exe; still locked if the previous instance hasn't exited yet
+    try:
+        os.remove(os.path.join(BASE_DIR, "modmanager.exe.old"))
+    except OSError:
+        pass
     app = QApplication(sys.argv)
     window = ModManager()
     window.show()
@@ -1,9 +1,12 @@
 import os
 import sys
 import json
+import queue
 import shutil
 import zipfile
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import Tk, Label, Button, StringVar, IntVar, Checkbutton, Entry, filedialog, messagebox
 from tkinter.ttk import Progressbar
 import requests
@@ -15,8 +18,30 @@ UPDATE_EXE_NAME = "update.exe"
 RESOURCES_ZIP_NAME = "resources.zip"
 
 SETTINGS_FILE = "install_path.json"
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+PROGRESS_STEP = 1024 * 1024  # refresh the progress bar at most once per MiB
+EXTRACT_WORKERS = 8
 resources_folder_name = "resources"
 
+# -------------------- FILES --------------------
+def _atomic_write_json(path, text):
+    """Replace path with the JSON text; a crash mid-write leaves the old file intact."""
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+# -------------------- ZIP --------------------
+def extract_members(zip_path, members):
+    """Write (member, target path) pairs; every worker opens its own ZipFile,
+    a shared one would serialize the reads on its file handle."""
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        for member, target_path in members:
+            with zip_ref.open(member) as source, open(target_path, 'wb') as target:
+                shutil.copyfileobj(source, target)
+
 # -------------------- GUI --------------------
 class InstallerUpdater:
     def __init__(self, root):
@@ -47,9 +72,13 @@ class InstallerUpdater:
         Label(root, textvariable=self.status_var).pack(pady=5)
 
         # Buttons
-        Button(root, text="Install / Update", command=self.run).pack(pady=10)
+        self.run_button = Button(root, text="Install / Update", command=self.run)
+        self.run_button.pack(pady=10)
         Button(root, text="Exit", command=root.quit).pack()
 
+        # The install runs on a worker thread and reports through this queue
+        self.events = queue.Queue()
+
     # -------------------- PATH --------------------
     def browse_path(self):
         folder = filedialog.askdirectory()
@@ -67,8 +96,9 @@ class InstallerUpdater:
 
     def save_install_path(self):
         data = {"install_path": self.path_var.get()}
-        with open(SETTINGS_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        # fsync can stall for a while on Windows; keep it off the Tk thread
+        threading.Thread(target=_atomic_write_json,
+                         args=(SETTINGS_FILE, json.dumps(data, indent=2))).start()
 
     # -------------------- DOWNLOAD --------------------
     def download_file(self, url, dest):
@@ -76,17 +106,23 @@ class InstallerUpdater:
             r.raise_for_status()
             total = int(r.headers.get('content-length', 0))
             downloaded = 0
+            last_reported = 0
             with open(dest, 'wb') as f:
-                for chunk in r.iter_content(chunk_size=8192):
+                for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     if chunk:
                         f.write(chunk)
                         downloaded += len(chunk)
-                        percent = int(downloaded / total * 100) if total else 0
-                        self.progress.set(percent)
-                        self.root.update_idletasks()
+                        if downloaded - last_reported >= PROGRESS_STEP:
+                            last_reported = downloaded
+                            self.events.put(("progress", (downloaded, total)))
+            self.events.put(("progress", (downloaded, total)))
 
     # -------------------- UTILS --------------------
     def unzip_and_merge(self, zip_path, dest_folder):
+        # The archive is mostly small icons, so the time goes into per-file
+        # open/close; create the folders first, then write files in parallel
+        folders = set()
+        files = []
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
             for member in zip_ref.namelist():
                 # Remove top-level "resources/" folder if present
@@ -95,11 +131,17 @@ class InstallerUpdater:
                     parts = parts[1:]
                 target_path = os.path.join(dest_folder, *parts)
                 if member.endswith('/'):
-                    os.makedirs(target_path, exist_ok=True)
+                    folders.add(target_path)
                 else:
-                    os.makedirs(os.path.dirname(target_path), exist_ok=True)
-                    with zip_ref.open(member) as source, open(target_path, 'wb') as target:
-                        shutil.copyfileobj(source, target)
+                    folders.add(os.path.dirname(target_path))
+                    files.append((member, target_path))
+        for folder in folders:
+            os.makedirs(folder, exist_ok=True)
+        batches = [files[i::EXTRACT_WORKERS] for i in range(EXTRACT_WORKERS)]
+        with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as pool:
+            jobs = [pool.submit(extract_members, zip_path, batch) for batch in batches if batch]
+            for job in jobs:
+                job.result()  # re-raise the first failure
 
     def create_shortcut(self, exe_path):
         try:
@@ -130,50 +172,82 @@ class InstallerUpdater:
             messagebox.showerror("Error", "Please select an installation path.")
             return
         self.save_install_path()
-        os.makedirs(install_dir, exist_ok=True)
-        modmanager_path = os.path.join(install_dir, MODMANAGER_EXE_NAME)
-        update_path = os.path.join(install_dir, UPDATE_EXE_NAME)
-        resources_path = os.path.join(install_dir, resources_folder_name)
-
-        self.status_var.set("Updating Mod-Manager...")
-        self.root.update_idletasks()
-
-        # -------------------- CLOSE MODMANAGER --------------------
-        self.close_modmanager(install_dir)
-
-        # -------------------- DOWNLOAD UPDATE.EXE --------------------
-        update_new_path = os.path.join(install_dir, "update_new.exe")
-        if not os.path.exists(update_new_path):
-            self.status_var.set("Downloading updater...")
-            self.root.update_idletasks()
-            self.download_file(f"{GITHUB_RELEASES_URL}/{UPDATE_EXE_NAME}", update_new_path)
-
-        # -------------------- DOWNLOAD MODMANAGER --------------------
-        self.status_var.set("Downloading Mod-Manager...")
-        self.root.update_idletasks()
-        if os.path.exists(modmanager_path):
-            old_path = modmanager_path.replace(".exe", "_old.exe")
-            os.rename(modmanager_path, old_path)
-        self.download_file(f"{GITHUB_RELEASES_URL}/{MODMANAGER_EXE_NAME}", modmanager_path)
-        if os.path.exists(modmanager_path.replace(".exe", "_old.exe")):
-            os.remove(modmanager_path.replace(".exe", "_old.exe"))
-
-        # -------------------- DOWNLOAD RESOURCES --------------------
-        self.status_var.set("Downloading resources...")
-        self.root.update_idletasks()
-        tmp_zip = os.path.join(install_dir, RESOURCES_ZIP_NAME)
-        self.download_file(f"{GITHUB_RELEASES_URL}/{RESOURCES_ZIP_NAME}", tmp_zip)
-        os.makedirs(resources_path, exist_ok=True)
-        self.unzip_and_merge(tmp_zip, resources_path)
-        os.remove(tmp_zip)
+        self.run_button.config(state="disabled")
+        # Downloads and extraction happen off the Tk thread; drain_events
+        # applies their status and progress at most 10 times a second
+        threading.Thread(target=self.install, args=(install_dir,), daemon=True).start()
+        self.root.after(100, self.drain_events)
+
+    def install(self, install_dir):
+        # Worker thread: no tkinter calls in here, only self.events
+        try:
+            os.makedirs(install_dir, exist_ok=True)
+            modmanager_path = os.path.join(install_dir, MODMANAGER_EXE_NAME)
+            resources_path = os.path.join(install_dir, resources_folder_name)
+
+            self.events.put(("status", "Updating Mod-Manager..."))
+
+            # -------------------- CLOSE MODMANAGER --------------------
+            self.close_modmanager(install_dir)
+
+            # -------------------- DOWNLOAD UPDATE.EXE --------------------
+            update_new_path = os.path.join(install_dir, "update_new.exe")
+            if not os.path.exists(update_new_path):
+                self.events.put(("status", "Downloading updater..."))
+                self.download_file(f"{GITHUB_RELEASES_URL}/{UPDATE_EXE_NAME}", update_new_path)
+
+            # -------------------- DOWNLOAD MODMANAGER --------------------
+            self.events.put(("status", "Downloading Mod-Manager..."))
+            if os.path.exists(modmanager_path):
+                old_path = modmanager_path.replace(".exe", "_old.exe")
+                os.rename(modmanager_path, old_path)
+            self.download_file(f"{GITHUB_RELEASES_URL}/{MODMANAGER_EXE_NAME}", modmanager_path)
+            if os.path.exists(modmanager_path.replace(".exe", "_old.exe")):
+                os.remove(modmanager_path.replace(".exe", "_old.exe"))
+
+            # -------------------- DOWNLOAD RESOURCES --------------------
+            self.events.put(("status", "Downloading resources..."))
+            tmp_zip = os.path.join(install_dir, RESOURCES_ZIP_NAME)
+            self.download_file(f"{GITHUB_RELEASES_URL}/{RESOURCES_ZIP_NAME}", tmp_zip)
+            os.makedirs(resources_path, exist_ok=True)
+            self.unzip_and_merge(tmp_zip, resources_path)
+            os.remove(tmp_zip)
+        except Exception as e:
+            self.events.put(("error", str(e)))
+            return
+        self.events.put(("done", modmanager_path))
+
+    def drain_events(self):
+        progress = None
+        while True:
+            try:
+                kind, value = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                progress = value  # only the latest one is worth drawing
+            elif kind == "status":
+                self.status_var.set(value)
+            elif kind == "error":
+                self.status_var.set("Update failed.")
+                self.run_button.config(state="normal")
+                messagebox.showerror("Error", value)
+                return
+            elif kind == "done":
+                self.finish(value)
+                return
+        if progress is not None:
+            downloaded, total = progress
+            self.progress.set(int(downloaded / total * 100) if total else 0)
+        self.root.after(100, self.drain_events)
 
+    def finish(self, modmanager_path):
         # -------------------- CREATE SHORTCUT --------------------
         if self.create_shortcut_var.get():
             self.create_shortcut(modmanager_path)
 
         self.status_var.set("Finished updating!")
         self.progress.set(100)
-        self.root.update_idletasks()
 
         # -------------------- LAUNCH MODMANAGER --------------------
         subprocess.Popen(modmanager_path)